@@ -0,0 +1,26 @@
+"""Build the optional compiled extensions.
+
+Project metadata lives in pyproject.toml. The extensions are marked
+optional, so installs without a C compiler fall back to the pure-Python
+and Numba code paths.
+"""
+
+from setuptools import Extension, setup
+
+try:
+    from Cython.Build import cythonize
+except ImportError:
+    ext_modules = []
+else:
+    ext_modules = cythonize(
+        [
+            Extension(
+                "snake_in_box.utils._canonical",
+                ["snake_in_box/utils/_canonical.pyx"],
+                optional=True,
+            )
+        ],
+        language_level=3,
+    )
+
+setup(ext_modules=ext_modules)
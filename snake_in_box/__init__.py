@@ -26,9 +26,6 @@ from .utils import (
     is_canonical,
     get_legal_next_dimensions,
     export_snake,
-    visualize_snake_3d,
-    visualize_snake_auto,
-    generate_16d_panel,
 )
 from .benchmarks import (
     get_known_record,
@@ -44,6 +41,18 @@ from .analysis import (
     generate_exponential_analysis_report,
 )
 
+# Visualization entry points are resolved lazily by snake_in_box.utils so
+# importing the package does not load matplotlib
+_LAZY_UTILS = ("visualize_snake_3d", "visualize_snake_auto", "generate_16d_panel")
+
+
+def __getattr__(name):
+    if name in _LAZY_UTILS:
+        from . import utils
+        return getattr(utils, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 __all__ = [
     "HypercubeBitmap",
     "SnakeNode",
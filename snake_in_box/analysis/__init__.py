@@ -10,6 +10,7 @@ from .exponential_analysis import (
     identify_slowdown_points,
     fit_exponential_model,
     estimate_time_for_dimension,
+    estimate_time_for_dimensions,
     generate_exponential_report,
 )
 
@@ -24,6 +25,7 @@ __all__ = [
     "identify_slowdown_points",
     "fit_exponential_model",
     "estimate_time_for_dimension",
+    "estimate_time_for_dimensions",
     "generate_exponential_report",
 ]
 
@@ -215,10 +215,35 @@ def estimate_time_for_dimension(N: int, model_params: Dict) -> float:
     float
         Estimated time in seconds
     """
+    return float(estimate_time_for_dimensions(np.array([N]), model_params)[0])
+
+
+def estimate_time_for_dimensions(dims: np.ndarray, model_params: Dict) -> np.ndarray:
+    """Estimate computation times for an array of dimensions.
+    
+    Evaluates time(N) = a * b^N elementwise from the fitted ``coefficient``
+    and ``base``; parameter dicts without them fall back to calling
+    ``model_function`` per dimension.
+    
+    Parameters
+    ----------
+    dims : np.ndarray
+        Dimensions to estimate (may be fractional, e.g. a plotting grid)
+    model_params : Dict
+        Model parameters from fit_exponential_model()
+    
+    Returns
+    -------
+    np.ndarray
+        Estimated times in seconds, same shape as ``dims``
+    """
+    dims = np.asarray(dims, dtype=np.float64)
     model_func = model_params.get('model_function')
-    if model_func:
-        return model_func(N)
-    return 0.0
+    if not model_func:
+        return np.zeros_like(dims)
+    if 'coefficient' in model_params and 'base' in model_params:
+        return model_params['coefficient'] * np.power(model_params['base'], dims)
+    return np.array([model_func(d) for d in dims.ravel()], dtype=np.float64).reshape(dims.shape)
 
 
 def analyze_memory_complexity(dimensions: List[int]) -> Dict[int, Dict]:
@@ -1,6 +1,6 @@
 """Report generation for analysis results."""
 
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, TextIO, Union
 from datetime import datetime
 import os
 from .analyze_dimensions import generate_statistics
@@ -14,7 +14,7 @@ from .exponential_analysis import (
 
 def generate_analysis_report(
     results: Dict[int, Dict],
-    output_file: str = "analysis_report.md",
+    output_file: Optional[Union[str, TextIO]] = "analysis_report.md",
     format: str = "markdown"
 ) -> str:
     """Generate comprehensive analysis report.
@@ -23,8 +23,9 @@ def generate_analysis_report(
     ----------
     results : Dict[int, Dict]
         Analysis results from analyze_dimensions
-    output_file : str, optional
-        Output file path (default: "analysis_report.md")
+    output_file : str, file-like or None, optional
+        Output file path, open text stream, or None to only return the
+        content (default: "analysis_report.md")
     format : str, optional
         Report format: 'markdown' or 'html' (default: 'markdown')
     
@@ -42,12 +43,27 @@ def generate_analysis_report(
     else:
         content = _generate_markdown_report(results, stats)
     
-    with open(output_file, 'w') as f:
-        f.write(content)
+    _write_report(content, output_file)
     
     return content
 
 
+def _write_report(content: str, output_file: Optional[Union[str, TextIO]]) -> None:
+    """Write report content to a path or stream; skip when output_file is None."""
+    if output_file is None:
+        return
+    if hasattr(output_file, 'write'):
+        output_file.write(content)
+        return
+    
+    # Create directory if needed (handle case where dirname is empty)
+    output_dir = os.path.dirname(output_file)
+    if output_dir:
+        os.makedirs(output_dir, exist_ok=True)
+    with open(output_file, 'w') as f:
+        f.write(content)
+
+
 def _generate_markdown_report(results: Dict[int, Dict], stats: Dict) -> str:
     """Generate Markdown report."""
     lines = []
@@ -185,7 +201,7 @@ def _generate_html_report(results: Dict[int, Dict], stats: Dict) -> str:
 
 def generate_validation_report(
     results: Dict[int, Dict],
-    output_file: str = "validation_report.md"
+    output_file: Optional[Union[str, TextIO]] = "validation_report.md"
 ) -> str:
     """Generate validation report.
     
@@ -193,8 +209,9 @@ def generate_validation_report(
     ----------
     results : Dict[int, Dict]
         Analysis results
-    output_file : str, optional
-        Output file path (default: "validation_report.md")
+    output_file : str, file-like or None, optional
+        Output file path, open text stream, or None to only return the
+        content (default: "validation_report.md")
     
     Returns
     -------
@@ -239,15 +256,14 @@ def generate_validation_report(
     
     content = "\n".join(lines)
     
-    with open(output_file, 'w') as f:
-        f.write(content)
+    _write_report(content, output_file)
     
     return content
 
 
 def generate_performance_report(
     results: Dict[int, Dict],
-    output_file: str = "performance_report.md"
+    output_file: Optional[Union[str, TextIO]] = "performance_report.md"
 ) -> str:
     """Generate performance report.
     
@@ -255,8 +271,9 @@ def generate_performance_report(
     ----------
     results : Dict[int, Dict]
         Analysis results
-    output_file : str, optional
-        Output file path (default: "performance_report.md")
+    output_file : str, file-like or None, optional
+        Output file path, open text stream, or None to only return the
+        content (default: "performance_report.md")
     
     Returns
     -------
@@ -296,19 +313,14 @@ def generate_performance_report(
     
     content = "\n".join(lines)
     
-    # Create directory if needed (handle case where dirname is empty)
-    output_dir = os.path.dirname(output_file)
-    if output_dir:
-        os.makedirs(output_dir, exist_ok=True)
-    with open(output_file, 'w') as f:
-        f.write(content)
+    _write_report(content, output_file)
     
     return content
 
 
 def generate_exponential_analysis_report(
     results: Dict[int, Dict],
-    output_file: str = "output/reports/exponential_analysis.md"
+    output_file: Optional[Union[str, TextIO]] = "output/reports/exponential_analysis.md"
 ) -> str:
     """Generate exponential slowdown analysis report.
     
@@ -316,8 +328,9 @@ def generate_exponential_analysis_report(
     ----------
     results : Dict[int, Dict]
         Analysis results with computation times
-    output_file : str, optional
-        Output file path
+    output_file : str, file-like or None, optional
+        Output file path, open text stream, or None to only return the
+        content
     
     Returns
     -------
@@ -436,12 +449,7 @@ def generate_exponential_analysis_report(
     
     content = "\n".join(lines)
     
-    # Create directory if needed (handle case where dirname is empty)
-    output_dir = os.path.dirname(output_file)
-    if output_dir:
-        os.makedirs(output_dir, exist_ok=True)
-    with open(output_file, 'w') as f:
-        f.write(content)
+    _write_report(content, output_file)
     
     return content
 
@@ -1,6 +1,8 @@
 from .known_snakes import (
     get_known_record,
     get_known_snake,
+    validate_known_snake,
+    validate_all_known_snakes,
     KNOWN_RECORDS,
 )
 from .performance import profile_memory_usage, profile_performance
@@ -8,6 +10,8 @@ from .performance import profile_memory_usage, profile_performance
 __all__ = [
     "get_known_record",
     "get_known_snake",
+    "validate_known_snake",
+    "validate_all_known_snakes",
     "KNOWN_RECORDS",
     "profile_memory_usage",
     "profile_performance",
@@ -1,7 +1,9 @@
 """Database of known snake-in-the-box records."""
 
-from typing import Dict, List, Optional
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple
 from ..core.transitions import parse_hex_transition_string, transition_to_vertex
+from ..utils._pool import spawn_context
 
 # Known record lengths from Ace (2025) and literature
 KNOWN_RECORDS: Dict[int, int] = {
@@ -162,3 +164,33 @@ def validate_known_snake(dimension: int) -> tuple[bool, str]:
     
     return validate_transition_sequence(transitions, dimension)
 
+
+def validate_all_known_snakes(
+    max_workers: Optional[int] = 1
+) -> Dict[int, Tuple[bool, str]]:
+    """Validate every known snake, optionally one dimension per worker process.
+    
+    Validation runs in-process by default: all five snakes check in well
+    under a second, less than it takes to start a worker pool. With
+    ``max_workers`` other than 1, workers receive only the dimension and
+    rebuild the snake from the module-level hex string, so no long
+    sequences are pickled.
+    
+    Parameters
+    ----------
+    max_workers : int, optional
+        Number of worker processes. 1 (default) validates serially in this
+        process; None uses the ProcessPoolExecutor default.
+    
+    Returns
+    -------
+    Dict[int, Tuple[bool, str]]
+        Mapping from dimension to (is_valid, message)
+    """
+    dimensions = sorted(TRUNCATION_POINTS)
+    if max_workers == 1:
+        return {dim: validate_known_snake(dim) for dim in dimensions}
+    with ProcessPoolExecutor(max_workers=max_workers,
+                             mp_context=spawn_context()) as executor:
+        results = executor.map(validate_known_snake, dimensions)
+        return dict(zip(dimensions, results))
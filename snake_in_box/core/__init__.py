@@ -3,8 +3,10 @@ from .snake_node import SnakeNode
 from .transitions import (
     vertex_to_transition,
     transition_to_vertex,
+    transition_to_vertex_array,
     compute_current_vertex,
     parse_hex_transition_string,
+    CanonicalState,
 )
 from .validation import (
     validate_snake,
@@ -18,8 +20,10 @@ __all__ = [
     "SnakeNode",
     "vertex_to_transition",
     "transition_to_vertex",
+    "transition_to_vertex_array",
     "compute_current_vertex",
     "parse_hex_transition_string",
+    "CanonicalState",
     "validate_snake",
     "validate_transition_sequence",
     "hamming_distance",
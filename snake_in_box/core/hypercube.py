@@ -3,6 +3,16 @@
 import array
 from typing import List
 
+try:
+    # GMP's popcount uses hardware POPCNT where available
+    from gmpy2 import popcount as _popcount
+except ImportError:
+    if hasattr(int, 'bit_count'):
+        _popcount = int.bit_count
+    else:  # Python < 3.10
+        def _popcount(value: int) -> int:
+            return bin(value).count('1')
+
 
 class HypercubeBitmap:
     """Memory-efficient bitmap for tracking hypercube vertices.
@@ -87,9 +97,13 @@ class HypercubeBitmap:
         return count
     
     def count_unmarked_fast(self) -> int:
-        """Count unmarked vertices using popcount."""
-        marked_bits = sum(bin(word).count('1') for word in self.bitmap)
-        return self.num_vertices - marked_bits
+        """Count unmarked vertices using popcount.
+        
+        The word array is reinterpreted as one arbitrary-precision integer
+        so the whole bitmap is counted in a single C-level call.
+        """
+        packed = int.from_bytes(self.bitmap.tobytes(), 'little')
+        return self.num_vertices - _popcount(packed)
     
     def clear_all(self) -> None:
         """Clear all bits."""
@@ -2,7 +2,7 @@
 
 from typing import List
 from .hypercube import HypercubeBitmap
-from .transitions import compute_current_vertex
+from .transitions import CanonicalState
 
 
 class SnakeNode:
@@ -23,6 +23,12 @@ class SnakeNode:
         Bitmap tracking vertex states
     fitness : int
         Count of unmarked (available) vertices
+    
+    The end vertex and a bitmask of blocked extension dimensions are cached
+    at construction so that ``can_extend`` is a single shift/AND in the BFS
+    inner loop. Children created with ``create_child`` inherit the parent's
+    bitmap and update fitness by the number of newly marked vertices rather
+    than rebuilding and recounting.
     """
     
     def __init__(self, transition_sequence: List[int], dimension: int):
@@ -40,9 +46,12 @@ class SnakeNode:
                     f"Transition {trans} out of range [0, {dimension})"
                 )
         
+        self._canonical = CanonicalState.from_sequence(transition_sequence)
+        
         # Initialize bitmap and calculate fitness
         self.vertices_bitmap = self._initialize_bitmap()
         self.fitness = self._calculate_fitness()
+        self._forbidden_mask = self._compute_forbidden_mask()
     
     def _get_used_dimensions(self) -> set:
         """Get set of dimensions used in the transition sequence."""
@@ -71,6 +80,7 @@ class SnakeNode:
             # Mark all adjacent vertices as prohibited (only in used dimensions)
             self._mark_adjacent(current_vertex, bitmap, used_dimensions)
         
+        self._current_vertex = current_vertex
         return bitmap
     
     def _mark_vertex(self, vertex: int, bitmap: HypercubeBitmap) -> None:
@@ -105,27 +115,41 @@ class SnakeNode:
     
     def _calculate_fitness(self) -> int:
         """Calculate fitness as count of unmarked vertices."""
-        return self.vertices_bitmap.count_unmarked()
+        return self.vertices_bitmap.count_unmarked_fast()
     
     def _is_marked(self, vertex: int) -> bool:
         """Check if vertex is marked."""
         return self.vertices_bitmap.get_bit(vertex)
     
+    def _compute_forbidden_mask(self) -> int:
+        """Build mask where bit d is set if the neighbor across d is marked."""
+        mask = 0
+        current_vertex = self._current_vertex
+        for dim in range(self.dimension):
+            if self._is_marked(current_vertex ^ (1 << dim)):
+                mask |= 1 << dim
+        return mask
+    
     def get_current_vertex(self) -> int:
         """Get current vertex (end of snake path)."""
-        return compute_current_vertex(self.transition_sequence)
+        return self._current_vertex
     
     def can_extend(self, new_dimension: int) -> bool:
         """Check if snake can be extended with given dimension."""
         if new_dimension < 0 or new_dimension >= self.dimension:
             return False
         
-        # Compute next vertex
-        current_vertex = self.get_current_vertex()
-        next_vertex = current_vertex ^ (1 << new_dimension)
+        # Next vertex is available iff its dimension bit is clear
+        return not (self._forbidden_mask >> new_dimension) & 1
+    
+    def get_legal_next_dimensions(self) -> List[int]:
+        """Get legal next dimensions for canonical extension.
         
-        # Check if next vertex is available (not marked)
-        return not self._is_marked(next_vertex)
+        Same result as ``utils.canonical.get_legal_next_dimensions`` on the
+        transition sequence, read from the node's ``CanonicalState``
+        instead of rescanning the sequence.
+        """
+        return self._canonical.legal_next_dimensions()
     
     def create_child(self, new_dimension: int) -> 'SnakeNode':
         """Create child node by extending snake."""
@@ -135,8 +159,43 @@ class SnakeNode:
                 f"next vertex is already marked"
             )
         
-        new_sequence = self.transition_sequence + [new_dimension]
-        return SnakeNode(new_sequence, self.dimension)
+        bitmap = self.vertices_bitmap.copy()
+        newly_marked = 0
+        canonical = self._canonical.extend(new_dimension)
+        
+        if not self._canonical.uses(new_dimension):
+            # Entering a new dimension prohibits the neighbor across it for
+            # every vertex already on the path, not just the new end vertex
+            step = 1 << new_dimension
+            vertex = 0
+            newly_marked += self._mark_if_unmarked(vertex ^ step, bitmap)
+            for transition in self.transition_sequence:
+                vertex ^= (1 << transition)
+                newly_marked += self._mark_if_unmarked(vertex ^ step, bitmap)
+        
+        next_vertex = self._current_vertex ^ (1 << new_dimension)
+        newly_marked += self._mark_if_unmarked(next_vertex, bitmap)
+        for dim in range(self.dimension):
+            if canonical.uses(dim):
+                newly_marked += self._mark_if_unmarked(next_vertex ^ (1 << dim), bitmap)
+        
+        child = SnakeNode.__new__(SnakeNode)
+        child.transition_sequence = self.transition_sequence + [new_dimension]
+        child.dimension = self.dimension
+        child.vertices_bitmap = bitmap
+        child.fitness = self.fitness - newly_marked
+        child._canonical = canonical
+        child._current_vertex = next_vertex
+        child._forbidden_mask = child._compute_forbidden_mask()
+        return child
+    
+    @staticmethod
+    def _mark_if_unmarked(vertex: int, bitmap: HypercubeBitmap) -> int:
+        """Mark vertex and return 1 if it was previously unmarked, else 0."""
+        if bitmap.get_bit(vertex):
+            return 0
+        bitmap.set_bit(vertex)
+        return 1
     
     def get_length(self) -> int:
         """Get snake length (number of edges)."""
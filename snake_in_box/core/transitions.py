@@ -1,6 +1,10 @@
 """Transition and vertex sequence conversion utilities."""
 
 from typing import List, Union
+import numpy as np
+
+# Below this length the plain loop beats NumPy's array setup cost
+_VECTORIZE_MIN_LENGTH = 128
 
 
 def vertex_to_transition(vertex_sequence: List[int]) -> List[int]:
@@ -101,6 +105,53 @@ def transition_to_vertex(
     return vertices
 
 
+def transition_to_vertex_array(
+    transition_sequence: List[int],
+    dimension: int,
+    start_vertex: int = 0
+) -> np.ndarray:
+    """Convert transition sequence to a vertex array.
+    
+    Array counterpart of ``transition_to_vertex``: the vertices are a
+    cumulative XOR of the flipped bits, computed without per-vertex
+    Python integers.
+    
+    Parameters
+    ----------
+    transition_sequence : List[int]
+        Sequence of bit positions to flip
+    dimension : int
+        Dimension of hypercube (at most 64)
+    start_vertex : int, optional
+        Starting vertex (default: 0, the origin)
+    
+    Returns
+    -------
+    np.ndarray
+        Vertex sequence starting from start_vertex, as uint32 for
+        dimension <= 32 and uint64 otherwise
+    
+    Examples
+    --------
+    >>> transition_to_vertex_array([0, 1, 2, 0], 3)
+    array([0, 1, 3, 7, 6], dtype=uint32)
+    """
+    dtype = np.uint32 if dimension <= 32 else np.uint64
+    transitions = np.asarray(transition_sequence, dtype=np.int64)
+    
+    out_of_range = (transitions < 0) | (transitions >= dimension)
+    if out_of_range.any():
+        transition = int(transitions[np.argmax(out_of_range)])
+        raise ValueError(
+            f"Transition {transition} out of range [0, {dimension})"
+        )
+    
+    flips = np.empty(len(transitions) + 1, dtype=dtype)
+    flips[0] = start_vertex
+    np.left_shift(1, transitions, out=flips[1:], casting='unsafe')
+    return np.bitwise_xor.accumulate(flips)
+
+
 def compute_current_vertex(transition_sequence: List[int]) -> int:
     """Compute current vertex from transition sequence.
     
@@ -121,12 +172,93 @@ def compute_current_vertex(transition_sequence: List[int]) -> int:
     >>> compute_current_vertex([0, 1, 2, 0])
     6
     """
+    if len(transition_sequence) >= _VECTORIZE_MIN_LENGTH:
+        bits = np.left_shift(1, np.asarray(transition_sequence, dtype=np.int64))
+        return int(np.bitwise_xor.reduce(bits))
+    
     vertex = 0
     for transition in transition_sequence:
         vertex ^= (1 << transition)
     return vertex
 
 
+class CanonicalState:
+    """Running summary of a transition sequence for canonical-form checks.
+    
+    Holds everything ``is_canonical`` and ``get_legal_next_dimensions``
+    need, so a search can extend it in O(1) per transition instead of
+    rescanning the sequence.
+    
+    Attributes
+    ----------
+    is_canonical : bool
+        Whether the sequence so far follows Kochut's canonical form
+    max_dim : int
+        Largest transition seen (-1 for the empty sequence)
+    used_mask : int
+        Bit d is set if transition d appears in the sequence
+    
+    Examples
+    --------
+    >>> state = CanonicalState.from_sequence([0, 1, 0])
+    >>> state.legal_next_dimensions()
+    [0, 1, 2]
+    >>> state.extend(3).is_canonical
+    False
+    """
+    
+    __slots__ = ('is_canonical', 'max_dim', 'used_mask')
+    
+    def __init__(self, is_canonical: bool = True, max_dim: int = -1, used_mask: int = 0):
+        self.is_canonical = is_canonical
+        self.max_dim = max_dim
+        self.used_mask = used_mask
+    
+    @classmethod
+    def from_sequence(cls, transition_sequence: List[int]) -> 'CanonicalState':
+        """Build the state in a single pass over a transition sequence."""
+        is_canonical = True
+        max_dim = -1
+        used_mask = 0
+        for dim in transition_sequence:
+            # Starting max_dim at -1 makes this also enforce a leading 0
+            if dim > max_dim + 1:
+                is_canonical = False
+            if dim > max_dim:
+                max_dim = dim
+            used_mask |= 1 << dim
+        return cls(is_canonical, max_dim, used_mask)
+    
+    def extend(self, dim: int) -> 'CanonicalState':
+        """Return the state after appending one transition."""
+        return CanonicalState(
+            self.is_canonical and dim <= self.max_dim + 1,
+            dim if dim > self.max_dim else self.max_dim,
+            self.used_mask | (1 << dim)
+        )
+    
+    def uses(self, dim: int) -> bool:
+        """Check whether transition dim appears in the sequence."""
+        return bool((self.used_mask >> dim) & 1)
+    
+    def legal_next_dimensions(self) -> List[int]:
+        """Previously used dimensions plus max_dim + 1, in ascending order."""
+        next_dim = self.max_dim + 1
+        if self.used_mask == (1 << next_dim) - 1:
+            # Canonical prefix: every dimension up to max_dim is used
+            return list(range(next_dim + 1))
+        return [
+            dim for dim in range(next_dim + 1)
+            if dim == next_dim or (self.used_mask >> dim) & 1
+        ]
+    
+    def __repr__(self) -> str:
+        return (
+            f"CanonicalState(is_canonical={self.is_canonical}, "
+            f"max_dim={self.max_dim}, used_mask={self.used_mask:#b})"
+        )
+
+
 def parse_hex_transition_string(hex_string: str) -> List[int]:
     """Parse transition sequence from hex string format.
     
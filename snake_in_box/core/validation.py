@@ -1,8 +1,13 @@
 """Validation functions for snake-in-the-box solutions."""
 
 from typing import List, Tuple
+import numpy as np
 from .transitions import transition_to_vertex
 
+# Rows of the pairwise XOR matrix processed at once; bounds peak memory
+# to about _PAIRWISE_BLOCK_ROWS * n * 8 bytes for long snakes.
+_PAIRWISE_BLOCK_ROWS = 512
+
 
 def hamming_distance(a: int, b: int) -> int:
     """Calculate Hamming distance between two integers.
@@ -65,26 +70,42 @@ def validate_snake(vertex_sequence: List[int]) -> Tuple[bool, str]:
     if n < 2:
         return True, "Valid snake (trivial case)"
     
-    # Check consecutive vertices have Hamming distance 1
-    for i in range(n - 1):
+    xs = np.asarray(vertex_sequence, dtype=np.int64)
+    
+    # Check consecutive vertices have Hamming distance 1: the XOR of each
+    # pair must be a nonzero power of two
+    steps = xs[1:] ^ xs[:-1]
+    bad_steps = np.flatnonzero((steps == 0) | ((steps & (steps - 1)) != 0))
+    if bad_steps.size:
+        i = int(bad_steps[0])
         hamming_dist = hamming_distance(vertex_sequence[i], vertex_sequence[i + 1])
-        if hamming_dist != 1:
-            return False, (
-                f"Consecutive vertices {i} and {i+1} have Hamming distance "
-                f"{hamming_dist}, expected 1"
-            )
+        return False, (
+            f"Consecutive vertices {i} and {i+1} have Hamming distance "
+            f"{hamming_dist}, expected 1"
+        )
     
     # Check non-consecutive vertices have Hamming distance > 1
     # This matches the C code: for (i = 2; i <= len; i++)
     #   for (j = 0; j <= i - 2; j++)
-    for i in range(2, n):
-        for j in range(i - 1):  # j from 0 to i-2 (inclusive)
+    # Distance <= 1 means the XOR is zero or a power of two. Rows are i,
+    # columns j, so the first hit in row-major order is the pair the C loop
+    # would report first.
+    for start in range(2, n, _PAIRWISE_BLOCK_ROWS):
+        stop = min(start + _PAIRWISE_BLOCK_ROWS, n)
+        xor = xs[start:stop, None] ^ xs[None, :stop - 2]
+        close = (xor & (xor - 1)) == 0
+        rows = np.arange(start, stop)[:, None]
+        cols = np.arange(stop - 2)[None, :]
+        close &= cols <= rows - 2
+        hits = np.argwhere(close)
+        if hits.size:
+            i = int(hits[0][0]) + start
+            j = int(hits[0][1])
             hamming_dist = hamming_distance(vertex_sequence[i], vertex_sequence[j])
-            if hamming_dist <= 1:
-                return False, (
-                    f"Non-consecutive vertices {j} and {i} have Hamming distance "
-                    f"{hamming_dist}, must be > 1"
-                )
+            return False, (
+                f"Non-consecutive vertices {j} and {i} have Hamming distance "
+                f"{hamming_dist}, must be > 1"
+            )
     
     return True, "Valid snake"
 
@@ -22,6 +22,7 @@ from snake_in_box.analysis.reporting import generate_performance_report, generat
 from snake_in_box.utils.graphical_abstract import generate_16d_panel
 from snake_in_box.utils.visualize_advanced import visualize_snake_auto
 from snake_in_box.utils.performance_plots import (
+    build_analysis_bundle,
     plot_computation_time_vs_dimension,
     plot_exponential_fit,
     plot_slowdown_analysis,
@@ -253,10 +254,12 @@ def main():
     print("Creating exponential analysis plots...")
     times_dict = {N: computation_times.get(N, 0.0) for N in range(1, 17) if N in snake_nodes}
     if times_dict:
+        memory_dims = list(range(1, 17))
+        bundle = build_analysis_bundle(times_dict, memory_dimensions=memory_dims)
         plot_computation_time_vs_dimension(times_dict, f"{output_base}/visualizations/computation_time_vs_dimension.png")
-        plot_exponential_fit(times_dict, f"{output_base}/visualizations/exponential_fit.png")
-        plot_slowdown_analysis(times_dict, f"{output_base}/visualizations/slowdown_analysis.png")
-        plot_memory_vs_dimension(list(range(1, 17)), f"{output_base}/visualizations/memory_vs_dimension.png")
+        plot_exponential_fit(times_dict, f"{output_base}/visualizations/exponential_fit.png", bundle=bundle)
+        plot_slowdown_analysis(times_dict, f"{output_base}/visualizations/slowdown_analysis.png", bundle=bundle)
+        plot_memory_vs_dimension(memory_dims, f"{output_base}/visualizations/memory_vs_dimension.png", bundle=bundle)
     
     # Step 7: Save data with exponential analysis
     print("\nSaving data...")
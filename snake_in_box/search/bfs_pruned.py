@@ -1,10 +1,9 @@
 """Heuristically-pruned breadth-first search algorithm."""
 
-from typing import List, Optional, Dict, Tuple
+from typing import List, Optional, Dict, Set, Tuple
 import sys
 import time
 from ..core.snake_node import SnakeNode
-from ..utils.canonical import get_legal_next_dimensions
 from .fitness import SimpleFitnessEvaluator
 
 
@@ -60,17 +59,23 @@ def pruned_bfs_search(
     while current_level:
         level_start_time = time.time()
         next_level: List[SnakeNode] = []
+        # Children with identical bitmap and head have identical futures
+        seen_states: Set[Tuple[bytes, int]] = set()
         
         # Generate all children for current level
         for node in current_level:
             # Get legal next dimensions (canonical form)
-            legal_dims = get_legal_next_dimensions(node.transition_sequence)
+            legal_dims = node.get_legal_next_dimensions()
             
             for dim in legal_dims:
                 # Check if extension is valid
                 if is_valid_extension(node, dim):
                     try:
                         child = node.create_child(dim)
+                        key = state_key(child)
+                        if key in seen_states:
+                            continue
+                        seen_states.add(key)
                         next_level.append(child)
                         total_nodes_explored += 1
                         
@@ -150,6 +155,25 @@ def is_valid_extension(node: SnakeNode, new_dimension: int) -> bool:
     return node.can_extend(new_dimension)
 
 
+def state_key(node: SnakeNode) -> Tuple[bytes, int]:
+    """Hashable key identifying a node's search state.
+    
+    Two nodes at the same level with equal bitmaps and the same end vertex
+    admit exactly the same extensions, so only one needs to be expanded.
+    
+    Parameters
+    ----------
+    node : SnakeNode
+        Node to key
+    
+    Returns
+    -------
+    Tuple[bytes, int]
+        (packed bitmap, current vertex)
+    """
+    return node.vertices_bitmap.bitmap.tobytes(), node.get_current_vertex()
+
+
 def prune_by_fitness(
     nodes: List[SnakeNode],
     memory_limit_gb: float
@@ -260,7 +284,7 @@ def estimate_branching_factor(nodes: List[SnakeNode]) -> int:
     # Rough estimate: average legal dimensions per node
     total_legal = 0
     for node in nodes[:min(100, len(nodes))]:  # Sample first 100
-        legal_dims = get_legal_next_dimensions(node.transition_sequence)
+        legal_dims = node.get_legal_next_dimensions()
         total_legal += len(legal_dims)
     
     avg_legal = total_legal / min(100, len(nodes))
@@ -1,8 +1,20 @@
 """Fitness evaluation functions."""
 
-from typing import Dict, Set
+from typing import Dict
+import numpy as np
+from ..core.hypercube import _popcount
 from ..core.snake_node import SnakeNode
-from ..core.transitions import compute_current_vertex
+
+# Within a 64-bit word, bit positions whose index has bit d set (d < 6).
+# Neighbors across such a dimension live in the same word, `1 << d` bits away.
+_INTRA_WORD_HIGH_MASKS = [
+    np.uint64(0xAAAAAAAAAAAAAAAA),
+    np.uint64(0xCCCCCCCCCCCCCCCC),
+    np.uint64(0xF0F0F0F0F0F0F0F0),
+    np.uint64(0xFF00FF00FF00FF00),
+    np.uint64(0xFFFF0000FFFF0000),
+    np.uint64(0xFFFFFFFF00000000),
+]
 
 
 class SimpleFitnessEvaluator:
@@ -66,18 +78,21 @@ class AdvancedFitnessEvaluator:
     def count_unreachable_vertices(self) -> int:
         """Count vertices unreachable from current position.
         
-        Uses flood fill (BFS) to find all reachable unmarked vertices
-        from the current snake position.
+        Uses a word-parallel flood fill over the bitmap to find all
+        unmarked vertices reachable from the current snake position.
         
         Returns
         -------
         int
             Number of unreachable unmarked vertices
         """
-        current_vertex = compute_current_vertex(self.node.transition_sequence)
-        reachable = self._flood_fill_reachable(current_vertex)
+        reachable = _flood_fill_count(
+            self.bitmap.bitmap,
+            self.node.get_current_vertex(),
+            self.dimension
+        )
         total_unmarked = self.count_unmarked_vertices()
-        return total_unmarked - len(reachable)
+        return total_unmarked - reachable
     
     def count_dead_ends(self) -> int:
         """Count unmarked vertices with only one unmarked neighbor.
@@ -134,36 +149,56 @@ class AdvancedFitnessEvaluator:
         fitness += weights.get('unreachable', 0.0) * self.count_unreachable_vertices()
         
         return fitness
-    
-    def _flood_fill_reachable(self, start_vertex: int) -> Set[int]:
-        """Find all reachable unmarked vertices from start using BFS.
-        
-        Parameters
-        ----------
-        start_vertex : int
-            Starting vertex for flood fill
-        
-        Returns
-        -------
-        Set[int]
-            Set of reachable unmarked vertex indices
-        """
-        visited: Set[int] = set()
-        queue = [start_vertex]
-        
-        while queue:
-            vertex = queue.pop(0)
-            
-            if vertex in visited or self.node._is_marked(vertex):
-                continue
-            
-            visited.add(vertex)
-            
-            # Add unmarked neighbors to queue
-            for dim in range(self.dimension):
-                neighbor = vertex ^ (1 << dim)
-                if neighbor not in visited:
-                    queue.append(neighbor)
-        
-        return visited
 
+
+def _flood_fill_count(marked_words, start_vertex: int, dimension: int) -> int:
+    """Count unmarked vertices reachable from start through unmarked vertices.
+    
+    The frontier is a set of bitmap words; each step moves every reached
+    vertex across all dimensions at once. Dimensions below 6 are shifts
+    inside a word, higher dimensions swap whole blocks of words.
+    
+    Parameters
+    ----------
+    marked_words : array-like
+        64-bit words of the vertex bitmap (1 = marked)
+    start_vertex : int
+        Vertex to expand from (itself excluded from the count)
+    dimension : int
+        Dimension of the hypercube
+    
+    Returns
+    -------
+    int
+        Number of reachable unmarked vertices
+    """
+    num_vertices = 1 << dimension
+    free = ~np.frombuffer(marked_words, dtype=np.uint64)
+    if num_vertices < 64:
+        free = free & np.uint64((1 << num_vertices) - 1)
+    
+    start_word = start_vertex >> 6
+    start_bit = np.uint64(1 << (start_vertex & 63))
+    # The snake head is marked but still acts as the source of the fill
+    free[start_word] |= start_bit
+    
+    reach = np.zeros_like(free)
+    reach[start_word] = start_bit
+    
+    while True:
+        expanded = reach.copy()
+        for dim in range(dimension):
+            if dim < 6:
+                stride = np.uint64(1 << dim)
+                high = _INTRA_WORD_HIGH_MASKS[dim]
+                expanded |= ((reach & ~high) << stride) | ((reach & high) >> stride)
+            else:
+                block = 1 << (dim - 6)
+                expanded |= reach.reshape(-1, 2, block)[:, ::-1, :].reshape(-1)
+        expanded &= free
+        if np.array_equal(expanded, reach):
+            break
+        reach = expanded
+    
+    reach[start_word] &= ~start_bit
+    return _popcount(int.from_bytes(reach.tobytes(), 'little'))
@@ -9,6 +9,7 @@ from .bfs_pruned import (
     estimate_memory_usage,
     prune_by_fitness,
     estimate_node_size,
+    state_key,
 )
 
 
@@ -69,10 +70,16 @@ def parallel_search(
                 ]
             )
         
-        # Collect results from all workers
+        # Collect results from all workers, dropping duplicate states that
+        # different workers reached independently
         next_level: List[SnakeNode] = []
+        seen_states = set()
         for worker_nodes in results:
-            next_level.extend(worker_nodes)
+            for child in worker_nodes:
+                key = state_key(child)
+                if key not in seen_states:
+                    seen_states.add(key)
+                    next_level.append(child)
         
         # Update best snake from shared state
         with best_snake_lock:
@@ -141,12 +148,10 @@ def expand_nodes_worker(
     List[SnakeNode]
         Expanded child nodes
     """
-    from ..utils.canonical import get_legal_next_dimensions
-    
     expanded: List[SnakeNode] = []
     
     for node in nodes:
-        legal_dims = get_legal_next_dimensions(node.transition_sequence)
+        legal_dims = node.get_legal_next_dimensions()
         
         for dim in legal_dims:
             if is_valid_extension(node, dim):
@@ -194,8 +194,7 @@ def pruned_bfs_search_from_seed(
                 try:
                     prefix_node = SnakeNode(prefix_seq, dimension)
                     # Check if this prefix can actually extend
-                    from ..utils.canonical import get_legal_next_dimensions
-                    legal_dims = get_legal_next_dimensions(prefix_seq)
+                    legal_dims = prefix_node.get_legal_next_dimensions()
                     new_dim = dimension - 1
                     
                     # Check if we can extend in the new dimension
@@ -215,8 +214,7 @@ def pruned_bfs_search_from_seed(
                 prefix_seq = seed_node.transition_sequence[:prefix_len]
                 try:
                     prefix_node = SnakeNode(prefix_seq, dimension)
-                    from ..utils.canonical import get_legal_next_dimensions
-                    legal_dims = get_legal_next_dimensions(prefix_seq)
+                    legal_dims = prefix_node.get_legal_next_dimensions()
                     new_dim = dimension - 1
                     can_extend_new_dim = prefix_node.can_extend(new_dim)
                     can_extend_any = any(prefix_node.can_extend(d) for d in legal_dims if d < dimension)
@@ -232,9 +230,8 @@ def pruned_bfs_search_from_seed(
     # But for high dimensions, be more lenient - include nodes that might extend after some backtracking
     viable_nodes = []
     for node in initial_nodes:
-        from ..utils.canonical import get_legal_next_dimensions
         from .bfs_pruned import is_valid_extension
-        legal_dims = get_legal_next_dimensions(node.transition_sequence)
+        legal_dims = node.get_legal_next_dimensions()
         new_dim = dimension - 1
         if new_dim not in legal_dims and new_dim < dimension:
             legal_dims = list(legal_dims) + [new_dim]
@@ -264,9 +261,8 @@ def pruned_bfs_search_from_seed(
                 try:
                     short_seq = seed_node.transition_sequence[:short_len]
                     short_node = SnakeNode(short_seq, dimension)
-                    from ..utils.canonical import get_legal_next_dimensions
                     from .bfs_pruned import is_valid_extension
-                    legal_dims = get_legal_next_dimensions(short_seq)
+                    legal_dims = short_node.get_legal_next_dimensions()
                     new_dim = dimension - 1
                     if new_dim not in legal_dims and new_dim < dimension:
                         legal_dims = list(legal_dims) + [new_dim]
@@ -307,10 +303,9 @@ def pruned_bfs_search_from_seed(
         
         # Generate all children for current level
         for node in current_level:
-            from ..utils.canonical import get_legal_next_dimensions
             from .bfs_pruned import is_valid_extension
             
-            legal_dims = get_legal_next_dimensions(node.transition_sequence)
+            legal_dims = node.get_legal_next_dimensions()
             
             # When extending to higher dimension, allow using the new dimension
             new_dim = dimension - 1
@@ -368,9 +363,8 @@ def pruned_bfs_search_from_seed(
                             try:
                                 prefix_seq = best_snake.transition_sequence[:prefix_len]
                                 prefix_node = SnakeNode(prefix_seq, dimension)
-                                from ..utils.canonical import get_legal_next_dimensions
                                 from .bfs_pruned import is_valid_extension
-                                legal_dims = get_legal_next_dimensions(prefix_seq)
+                                legal_dims = prefix_node.get_legal_next_dimensions()
                                 new_dim = dimension - 1
                                 if new_dim not in legal_dims and new_dim < dimension:
                                     legal_dims = list(legal_dims) + [new_dim]
@@ -395,9 +389,8 @@ def pruned_bfs_search_from_seed(
                                 try:
                                     prefix_seq = best_snake.transition_sequence[:short_len]
                                     prefix_node = SnakeNode(prefix_seq, dimension)
-                                    from ..utils.canonical import get_legal_next_dimensions
                                     from .bfs_pruned import is_valid_extension
-                                    legal_dims = get_legal_next_dimensions(prefix_seq)
+                                    legal_dims = prefix_node.get_legal_next_dimensions()
                                     new_dim = dimension - 1
                                     if new_dim not in legal_dims and new_dim < dimension:
                                         legal_dims = list(legal_dims) + [new_dim]
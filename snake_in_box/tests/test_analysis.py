@@ -1,11 +1,18 @@
 """Tests for analysis modules."""
 
+import io
 import unittest
+import numpy as np
 from snake_in_box.analysis.analyze_dimensions import (
     analyze_single_dimension,
     analyze_dimensions,
     generate_statistics,
 )
+from snake_in_box.analysis.exponential_analysis import (
+    fit_exponential_model,
+    estimate_time_for_dimension,
+    estimate_time_for_dimensions,
+)
 from snake_in_box.analysis.reporting import (
     generate_analysis_report,
     generate_validation_report,
@@ -85,13 +92,9 @@ class TestAnalysis(unittest.TestCase):
         }
         
         try:
-            content = generate_analysis_report(results, "test_report.md", format="markdown")
+            content = generate_analysis_report(results, None, format="markdown")
             self.assertIsInstance(content, str)
             self.assertIn("Analysis Report", content)
-            
-            import os
-            if os.path.exists("test_report.md"):
-                os.remove("test_report.md")
         except Exception as e:
             self.fail(f"Report generation failed: {e}")
     
@@ -107,13 +110,9 @@ class TestAnalysis(unittest.TestCase):
         }
         
         try:
-            content = generate_validation_report(results, "test_validation.md")
+            content = generate_validation_report(results, None)
             self.assertIsInstance(content, str)
             self.assertIn("Validation Report", content)
-            
-            import os
-            if os.path.exists("test_validation.md"):
-                os.remove("test_validation.md")
         except Exception as e:
             self.fail(f"Validation report generation failed: {e}")
     
@@ -131,15 +130,25 @@ class TestAnalysis(unittest.TestCase):
         }
         
         try:
-            content = generate_performance_report(results, "test_performance.md")
+            buffer = io.StringIO()
+            content = generate_performance_report(results, buffer)
             self.assertIsInstance(content, str)
             self.assertIn("Performance Report", content)
-            
-            import os
-            if os.path.exists("test_performance.md"):
-                os.remove("test_performance.md")
+            self.assertEqual(buffer.getvalue(), content)
         except Exception as e:
             self.fail(f"Performance report generation failed: {e}")
+    
+    def test_estimate_time_for_dimensions(self):
+        """Test vectorized time estimates against the model function."""
+        model = fit_exponential_model({3: 0.001, 4: 0.002, 5: 0.0041, 6: 0.0079})
+        dims = np.arange(3, 10, 0.5)
+        estimates = estimate_time_for_dimensions(dims, model)
+        np.testing.assert_allclose(estimates, [model['model_function'](d) for d in dims])
+        self.assertAlmostEqual(estimate_time_for_dimension(8, model), model['model_function'](8))
+        
+        custom = {'model_function': lambda N: 2.0 * N}
+        np.testing.assert_allclose(estimate_time_for_dimensions(dims, custom), 2.0 * dims)
+        self.assertEqual(estimate_time_for_dimension(4, {}), 0.0)
 
 
 if __name__ == '__main__':
@@ -5,6 +5,7 @@ from snake_in_box.benchmarks.known_snakes import (
     get_known_record,
     get_known_snake,
     validate_known_snake,
+    validate_all_known_snakes,
     KNOWN_RECORDS,
 )
 
@@ -42,6 +43,14 @@ class TestKnownSnakes(unittest.TestCase):
         is_valid, msg = validate_known_snake(13)
         self.assertTrue(is_valid, msg)
     
+    def test_validate_all_known_snakes(self):
+        """Test batch validation covers every stored snake."""
+        results = validate_all_known_snakes()
+        self.assertEqual(sorted(results), [9, 10, 11, 12, 13])
+        for dim, (is_valid, msg) in results.items():
+            self.assertTrue(is_valid, f"Dimension {dim}: {msg}")
+        self.assertEqual(validate_all_known_snakes(max_workers=2), results)
+    
     def test_known_records_completeness(self):
         """Test that known records are complete."""
         for dim in range(3, 14):
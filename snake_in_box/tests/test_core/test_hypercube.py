@@ -106,6 +106,15 @@ class TestHypercubeBitmap(unittest.TestCase):
         bitmap = HypercubeBitmap(10)
         self.assertEqual(bitmap.num_vertices, 1024)
         self.assertEqual(bitmap.count_unmarked(), 1024)
+    
+    def test_count_unmarked_fast_multiword(self):
+        """Test fast count agrees with full scan across word boundaries."""
+        bitmap = HypercubeBitmap(10)
+        for vertex in (0, 63, 64, 127, 500, 1023):
+            bitmap.set_bit(vertex)
+        
+        self.assertEqual(bitmap.count_unmarked_fast(), 1018)
+        self.assertEqual(bitmap.count_unmarked_fast(), bitmap.count_unmarked())
 
 
 if __name__ == '__main__':
@@ -2,6 +2,7 @@
 
 import unittest
 from snake_in_box.core.snake_node import SnakeNode
+from snake_in_box.utils.canonical import get_legal_next_dimensions
 
 
 class TestSnakeNode(unittest.TestCase):
@@ -45,6 +46,30 @@ class TestSnakeNode(unittest.TestCase):
         # Should not be able to extend back to vertex 0
         self.assertFalse(node.can_extend(0))
     
+    def test_can_extend_matches_bitmap(self):
+        """Test cached extension mask agrees with direct bitmap lookup."""
+        node = SnakeNode([0, 1, 2, 0, 3], 5)
+        current = node.get_current_vertex()
+        
+        for dim in range(5):
+            expected = not node._is_marked(current ^ (1 << dim))
+            self.assertEqual(node.can_extend(dim), expected)
+        
+        self.assertFalse(node.can_extend(-1))
+        self.assertFalse(node.can_extend(5))
+    
+    def test_get_legal_next_dimensions(self):
+        """Test cached legal dimensions match the sequence-based helper."""
+        for sequence in ([], [0], [0, 1, 2], [0, 2], [1]):
+            node = SnakeNode(sequence, 4)
+            self.assertEqual(
+                node.get_legal_next_dimensions(),
+                get_legal_next_dimensions(sequence)
+            )
+        
+        child = SnakeNode([0, 1], 4).create_child(2)
+        self.assertEqual(child.get_legal_next_dimensions(), [0, 1, 2, 3])
+    
     def test_create_child(self):
         """Test creating child node."""
         node = SnakeNode([0, 1], 3)
@@ -54,6 +79,18 @@ class TestSnakeNode(unittest.TestCase):
         self.assertEqual(child.transition_sequence, [0, 1, 2])
         self.assertEqual(child.get_current_vertex(), 7)
     
+    def test_create_child_matches_rebuild(self):
+        """Test incremental child state equals a node built from scratch."""
+        node = SnakeNode([], 5)
+        for dim in range(5):
+            node = node.create_child(dim)
+            rebuilt = SnakeNode(list(node.transition_sequence), 5)
+            
+            self.assertEqual(node.fitness, rebuilt.fitness)
+            self.assertEqual(node.fitness, node.vertices_bitmap.count_unmarked())
+            self.assertEqual(node.vertices_bitmap.bitmap, rebuilt.vertices_bitmap.bitmap)
+            self.assertEqual(node.get_current_vertex(), rebuilt.get_current_vertex())
+    
     def test_create_child_invalid(self):
         """Test creating invalid child."""
         node = SnakeNode([0, 1], 3)
@@ -4,6 +4,7 @@ import unittest
 from snake_in_box.core.transitions import (
     vertex_to_transition,
     transition_to_vertex,
+    transition_to_vertex_array,
     compute_current_vertex,
     parse_hex_transition_string,
 )
@@ -51,12 +52,32 @@ class TestTransitions(unittest.TestCase):
         with self.assertRaises(ValueError):
             transition_to_vertex([0, 5], 3)  # 5 >= 3
     
+    def test_transition_to_vertex_array(self):
+        """Test array conversion matches the list conversion."""
+        transitions = [0, 1, 2, 0, 5, 3, 1, 4]
+        for dimension, start in ((6, 0), (6, 9), (40, 1 << 35)):
+            vertices = transition_to_vertex_array(transitions, dimension, start)
+            self.assertEqual(
+                vertices.tolist(),
+                transition_to_vertex(transitions, dimension, start)
+            )
+        self.assertEqual(str(transition_to_vertex_array([0], 3).dtype), 'uint32')
+        self.assertEqual(transition_to_vertex_array([], 3).tolist(), [0])
+        with self.assertRaises(ValueError):
+            transition_to_vertex_array([0, 5], 3)
+    
     def test_compute_current_vertex(self):
         """Test computing current vertex."""
         transitions = [0, 1, 2, 0]
         vertex = compute_current_vertex(transitions)
         self.assertEqual(vertex, 6)
     
+    def test_compute_current_vertex_long(self):
+        """Test vectorized path agrees with the vertex sequence end."""
+        transitions = [0, 1, 2, 0, 3, 1, 4, 2] * 40
+        vertices = transition_to_vertex(transitions, 5)
+        self.assertEqual(compute_current_vertex(transitions), vertices[-1])
+    
     def test_compute_current_vertex_empty(self):
         """Test with empty sequence."""
         self.assertEqual(compute_current_vertex([]), 0)
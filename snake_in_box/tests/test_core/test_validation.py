@@ -7,6 +7,8 @@ from snake_in_box.core.validation import (
     hamming_distance,
     validate_snake_from_hex_string,
 )
+from snake_in_box.core.transitions import transition_to_vertex
+from snake_in_box.benchmarks.known_snakes import get_known_snake
 
 
 class TestValidation(unittest.TestCase):
@@ -45,6 +47,19 @@ class TestValidation(unittest.TestCase):
         self.assertIn("Non-consecutive", msg)
         self.assertIn("must be > 1", msg)
     
+    def test_validate_snake_long_sequence(self):
+        """Test pairwise check on a snake spanning several row blocks."""
+        vertices = transition_to_vertex(get_known_snake(11), 11)
+        is_valid, msg = validate_snake(vertices)
+        self.assertTrue(is_valid)
+        self.assertEqual(msg, "Valid snake")
+        
+        # Step from vertex 699 into a vertex adjacent to vertex 189
+        invalid = vertices[:700] + [vertices[699] ^ 0b10]
+        is_valid, msg = validate_snake(invalid)
+        self.assertFalse(is_valid)
+        self.assertIn("Non-consecutive vertices 189 and 700", msg)
+    
     def test_validate_snake_trivial(self):
         """Test validation of trivial cases."""
         is_valid, msg = validate_snake([])
@@ -7,6 +7,7 @@ from snake_in_box.search.bfs_pruned import (
     prune_by_fitness,
     estimate_memory_usage,
     estimate_node_size,
+    state_key,
 )
 from snake_in_box.core.snake_node import SnakeNode
 
@@ -21,6 +22,13 @@ class TestBFSPruned(unittest.TestCase):
         self.assertTrue(is_valid_extension(node, 2))
         self.assertFalse(is_valid_extension(node, 0))  # Would go back
     
+    def test_state_key(self):
+        """Test state key distinguishes bitmap and head, not history."""
+        node = SnakeNode([0, 1], 3)
+        self.assertEqual(state_key(node), state_key(SnakeNode([0, 1], 3)))
+        self.assertNotEqual(state_key(node), state_key(node.create_child(2)))
+        self.assertEqual(state_key(node)[1], node.get_current_vertex())
+    
     def test_estimate_node_size(self):
         """Test node size estimation."""
         node = SnakeNode([0, 1, 2], 3)
@@ -2,9 +2,11 @@
 
 import unittest
 from snake_in_box.core.snake_node import SnakeNode
+from snake_in_box.core.hypercube import HypercubeBitmap
 from snake_in_box.search.fitness import (
     SimpleFitnessEvaluator,
     AdvancedFitnessEvaluator,
+    _flood_fill_count,
 )
 
 
@@ -44,6 +46,32 @@ class TestFitness(unittest.TestCase):
         unreachable = evaluator.count_unreachable_vertices()
         self.assertGreaterEqual(unreachable, 0)
     
+    def test_flood_fill_count(self):
+        """Test word-parallel flood fill against a vertex-by-vertex BFS."""
+        for dimension in (3, 7):
+            bitmap = HypercubeBitmap(dimension)
+            # Wall off every vertex whose lowest two bits are both set
+            for vertex in range(1 << dimension):
+                if vertex & 3 == 3:
+                    bitmap.set_bit(vertex)
+            start = 0
+            bitmap.set_bit(start)
+            
+            seen = {start}
+            queue = [start]
+            while queue:
+                vertex = queue.pop()
+                for dim in range(dimension):
+                    neighbor = vertex ^ (1 << dim)
+                    if neighbor not in seen and not bitmap.get_bit(neighbor):
+                        seen.add(neighbor)
+                        queue.append(neighbor)
+            
+            self.assertEqual(
+                _flood_fill_count(bitmap.bitmap, start, dimension),
+                len(seen) - 1
+            )
+    
     def test_advanced_fitness_combined(self):
         """Test combined fitness."""
         node = SnakeNode([0, 1], 3)
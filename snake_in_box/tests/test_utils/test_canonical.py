@@ -1,9 +1,16 @@
 """Tests for canonical form utilities."""
 
+import subprocess
+import sys
 import unittest
+import numpy as np
 from snake_in_box.utils.canonical import (
     is_canonical,
     get_legal_next_dimensions,
+    canonical_state,
+    _is_canonical_scan,
+    _is_canonical_branchless,
+    _is_canonical_ext,
 )
 
 
@@ -27,6 +34,50 @@ class TestCanonical(unittest.TestCase):
         self.assertFalse(is_canonical([0, 1, 3]))  # 3 > max(0,1) + 1 = 2
         self.assertFalse(is_canonical([0, 2]))  # 2 > max(0) + 1 = 1
     
+    def test_is_canonical_long(self):
+        """Test long sequences, which take the compiled path when available."""
+        sequence = [0, 1, 0, 2, 0, 1, 0, 3] * 20
+        self.assertTrue(is_canonical(sequence))
+        self.assertFalse(is_canonical(sequence + [5]))
+        self.assertFalse(is_canonical([1] + sequence))
+    
+    def test_branchless_matches_scan(self):
+        """Test branch-free kernel agrees with the early-exit scan."""
+        cases = [[], [0], [1], [0, 2], [0, 1, 3], [0, 1, 0, 2, 1], [2, 1, 0]]
+        for sequence in cases:
+            self.assertEqual(
+                _is_canonical_branchless(sequence),
+                _is_canonical_scan(sequence)
+            )
+    
+    @unittest.skipIf(_is_canonical_ext is None, "C extension not built")
+    def test_extension_matches_scan(self):
+        """Test compiled extension agrees with the early-exit scan."""
+        cases = [[], [0], [1], [0, 2], [0, 1, 3], [0, 1, 0, 2, 1], [2, 1, 0]]
+        for sequence in cases:
+            array = np.asarray(sequence, dtype=np.int64)
+            self.assertEqual(
+                _is_canonical_ext(array),
+                _is_canonical_scan(sequence)
+            )
+    
+    def test_extension_skips_numba_import(self):
+        """Test Numba is not loaded when the extension is available."""
+        code = (
+            "import sys, types\n"
+            "stub = types.ModuleType('snake_in_box.utils._canonical')\n"
+            "stub.is_canonical_c = lambda array: True\n"
+            "sys.modules['snake_in_box.utils._canonical'] = stub\n"
+            "import snake_in_box\n"
+            "from snake_in_box.utils import canonical\n"
+            "print('numba' in sys.modules, canonical._is_canonical_jit)"
+        )
+        output = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True, text=True, check=True
+        ).stdout
+        self.assertEqual(output.strip(), "False None")
+    
     def test_get_legal_next_dimensions_empty(self):
         """Test legal dimensions for empty sequence."""
         legal = get_legal_next_dimensions([])
@@ -46,6 +97,34 @@ class TestCanonical(unittest.TestCase):
         """Test legal dimensions with repeated transitions."""
         legal = get_legal_next_dimensions([0, 1, 0, 2])
         self.assertEqual(set(legal), {0, 1, 2, 3})
+    
+    def test_get_legal_next_dimensions_non_canonical(self):
+        """Test sequences with gaps only allow used dimensions plus one."""
+        self.assertEqual(get_legal_next_dimensions([0, 2]), [0, 2, 3])
+        self.assertEqual(get_legal_next_dimensions([1]), [1, 2])
+
+    
+    def test_canonical_state_matches_separate_checks(self):
+        """Test fused state agrees with is_canonical and legal dimensions."""
+        cases = [[], [0], [1], [0, 2], [0, 1, 3], [0, 1, 0, 2, 1], [2, 1, 0]]
+        for sequence in cases:
+            state = canonical_state(sequence)
+            self.assertEqual(state.is_canonical, is_canonical(sequence))
+            self.assertEqual(
+                state.legal_next_dimensions(),
+                get_legal_next_dimensions(sequence)
+            )
+    
+    def test_canonical_state_extend(self):
+        """Test incremental extension equals recomputing from scratch."""
+        sequence = [0, 1, 0, 2, 1, 4, 0]
+        state = canonical_state([])
+        for i, dim in enumerate(sequence):
+            state = state.extend(dim)
+            expected = canonical_state(sequence[:i + 1])
+            self.assertEqual(state.is_canonical, expected.is_canonical)
+            self.assertEqual(state.max_dim, expected.max_dim)
+            self.assertEqual(state.used_mask, expected.used_mask)
 
 
 if __name__ == '__main__':
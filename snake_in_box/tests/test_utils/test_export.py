@@ -0,0 +1,184 @@
+"""Tests for export functions."""
+
+import csv
+import json
+import os
+import tarfile
+import tempfile
+import unittest
+from unittest import mock
+import numpy as np
+from snake_in_box.core.snake_node import SnakeNode
+from snake_in_box.core.transitions import parse_hex_transition_string
+from snake_in_box.utils.export import (
+    AnalysisTable,
+    Method,
+    export_snake,
+    export_analysis_data,
+    _dumps_json,
+    _hex_encode,
+)
+from snake_in_box.utils import export
+
+
+class TestExport(unittest.TestCase):
+    """Test cases for export functions."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.results = {
+            4: {
+                'length': 6, 'is_valid': False, 'method': 'search',
+                'computation_time_seconds': 1.5,
+            },
+            3: {
+                'length': 4, 'is_valid': True, 'method': 'known',
+                'computation_time_seconds': 0.5, 'known_record': 4,
+                'matches_known': True, 'transition_sequence': [0, 1, 2, 0],
+            },
+        }
+    
+    def test_hex_encode(self):
+        """Test transitions encode to one digit each, a=10 onward."""
+        self.assertEqual(_hex_encode([]), "")
+        self.assertEqual(_hex_encode([0, 1, 2, 0]), "0120")
+        self.assertEqual(_hex_encode([9, 10, 11, 15]), "9abf")
+    
+    def test_hex_encode_round_trip(self):
+        """Test encoded string parses back to the same transitions."""
+        transitions = [0, 1, 0, 2, 10, 12, 15, 3]
+        self.assertEqual(
+            parse_hex_transition_string(_hex_encode(transitions)),
+            transitions
+        )
+    
+    def test_export_snake(self):
+        """Test JSON and text files are written with matching content."""
+        node = SnakeNode([0, 1, 2], 3)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            base = os.path.join(tmpdir, "snake_3d")
+            export_snake(node, base)
+            
+            with open(base + ".json") as f:
+                data = json.load(f)
+            self.assertEqual(data['transition_sequence'], [0, 1, 2])
+            self.assertEqual(data['vertex_sequence'], [0, 1, 3, 7])
+            
+            with open(base + ".txt") as f:
+                self.assertEqual(f.read(), "012")
+            with open(base + "_comma.txt") as f:
+                self.assertEqual(f.read(), "0,1,2")
+    
+    def test_export_snake_archive(self):
+        """Test all formats are written as members of one tar archive."""
+        node = SnakeNode([0, 1, 2], 3)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            base = os.path.join(tmpdir, "snake_3d")
+            export_snake(node, base, archive=True)
+            self.assertEqual(os.listdir(tmpdir), ["snake_3d.tar"])
+            
+            with tarfile.open(base + ".tar") as tar:
+                self.assertEqual(
+                    sorted(tar.getnames()),
+                    ["snake_3d.json", "snake_3d.txt", "snake_3d_comma.txt"]
+                )
+                data = json.loads(tar.extractfile("snake_3d.json").read())
+                self.assertEqual(data['vertex_sequence'], [0, 1, 3, 7])
+                self.assertEqual(tar.extractfile("snake_3d.txt").read(), b"012")
+                self.assertEqual(tar.extractfile("snake_3d_comma.txt").read(), b"0,1,2")
+    
+    def test_dumps_json_paths_agree(self):
+        """Test orjson and stdlib output agree on text and floats."""
+        if export.orjson is None:
+            self.skipTest("orjson not installed")
+        plain = {'method': 'Méthode – ε', 3: [0.1, 2.0, 123456.789], 'v': np.arange(3)}
+        exponents = {'times': [1e16, 1.5e-7]}
+        
+        fast = _dumps_json(plain), _dumps_json(exponents)
+        with mock.patch.object(export, 'orjson', None):
+            slow = _dumps_json(plain), _dumps_json(exponents)
+        
+        self.assertEqual(fast[0], slow[0])
+        self.assertIn('Méthode – ε'.encode('utf-8'), slow[0])
+        self.assertEqual(json.loads(fast[1]), json.loads(slow[1]))
+    
+    def test_export_analysis_data(self):
+        """Test JSON, CSV and statistics exports for analysis results."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            files = export_analysis_data(self.results, output_dir=tmpdir)
+            
+            with open(files['json']) as f:
+                data = json.load(f)
+            self.assertEqual(data['metadata']['dimensions_analyzed'], [3, 4])
+            self.assertEqual(data['results']['3']['transition_sequence'], [0, 1, 2, 0])
+            
+            with open(files['csv']) as f:
+                lines = f.read().splitlines()
+            self.assertEqual(len(lines), 3)
+            self.assertTrue(lines[1].startswith("3,4,True,known"))
+            
+            with open(files['statistics']) as f:
+                stats = json.load(f)
+            self.assertEqual(stats['valid_snakes'], 1)
+            self.assertEqual(stats['invalid_snakes'], 1)
+            self.assertEqual(stats['from_known'], 1)
+            self.assertEqual(stats['from_search'], 1)
+            self.assertEqual(stats['total_length'], 10)
+            self.assertEqual(stats['average_length'], 5.0)
+            self.assertEqual(stats['total_time_seconds'], 2.0)
+
+    
+    def test_analysis_table(self):
+        """Test table columns, round trip and vectorized statistics."""
+        table = AnalysisTable.from_dict(self.results)
+        self.assertEqual(len(table), 2)
+        self.assertEqual(table.dims.tolist(), [3, 4])
+        self.assertEqual(table.method.tolist(), [Method.KNOWN, Method.SEARCH])
+        self.assertEqual(table.known_record.tolist(), [4, None])
+        self.assertEqual(
+            table.rows()[0],
+            (3, 4, True, 'known', 0, 0.5, 0.0, 4, True)
+        )
+        self.assertEqual(table.to_dict()[4]['length'], 6)
+        
+        stats = table.statistics()
+        self.assertEqual(stats['valid_snakes'], 1)
+        self.assertEqual(stats['from_search'], 1)
+        self.assertEqual(stats['average_length'], 5.0)
+        
+        self.results[5] = {'method': 'generated', 'length': 8}
+        table = AnalysisTable.from_dict(self.results)
+        self.assertEqual(table.method_names[table.method[2]], 'generated')
+        self.assertEqual(table.rows()[2][3], 'generated')
+        self.assertEqual(table.statistics()['from_known'], 1)
+        
+        empty = AnalysisTable.from_dict({})
+        self.assertEqual(empty.statistics()['average_length'], 0)
+    
+    def test_export_analysis_data_from_table(self):
+        """Test a table exports the same CSV and statistics as the dict."""
+        table = AnalysisTable.from_dict(self.results)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            dict_dir = os.path.join(tmpdir, "dict")
+            table_dir = os.path.join(tmpdir, "table")
+            dict_files = export_analysis_data(self.results, output_dir=dict_dir)
+            table_files = export_analysis_data(table, output_dir=table_dir)
+            
+            for key in ('csv', 'statistics'):
+                with open(dict_files[key]) as f, open(table_files[key]) as g:
+                    self.assertEqual(f.read(), g.read())
+    
+    def test_export_analysis_data_keeps_float_fitness(self):
+        """Test fractional fitness values reach the CSV unchanged."""
+        self.results[3]['fitness'] = 12.7
+        self.results[4]['fitness'] = 5
+        with tempfile.TemporaryDirectory() as tmpdir:
+            files = export_analysis_data(self.results, output_dir=tmpdir)
+            with open(files['csv'], newline='') as f:
+                rows = list(csv.reader(f))
+        self.assertEqual(rows[1][4], '12.7')
+        self.assertEqual(rows[2][4], '5')
+
+
+if __name__ == '__main__':
+    unittest.main()
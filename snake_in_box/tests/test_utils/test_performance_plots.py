@@ -0,0 +1,182 @@
+"""Tests for performance plotting functions."""
+
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+from unittest import mock
+from snake_in_box.analysis.exponential_analysis import (
+    fit_exponential_model,
+    analyze_computation_complexity,
+    identify_slowdown_points,
+)
+from snake_in_box.utils import _analysis_memo, performance_plots
+from snake_in_box.utils.performance_plots import (
+    HAS_MATPLOTLIB,
+    build_analysis_bundle,
+    _ensure_dir,
+    _new_figure,
+    _save_fig,
+    plot_computation_time_vs_dimension,
+    plot_exponential_fit,
+    plot_slowdown_analysis,
+    plot_memory_vs_dimension,
+)
+
+
+class TestPerformancePlots(unittest.TestCase):
+    """Test cases for performance plots."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.times = {3: 0.001, 4: 0.003, 5: 0.01, 6: 0.05, 7: 0.2}
+        _analysis_memo.clear_analysis_cache()
+    
+    def test_cached_analysis_matches_direct(self):
+        """Test memoized analysis against the direct functions."""
+        model = _analysis_memo.fit_exponential_model_cached(self.times)
+        expected = fit_exponential_model(self.times)
+        self.assertAlmostEqual(model['base'], expected['base'])
+        self.assertAlmostEqual(model['r_squared'], expected['r_squared'])
+        self.assertEqual(
+            _analysis_memo.analyze_computation_complexity_cached(self.times)['exponential_regions'],
+            analyze_computation_complexity(self.times)['exponential_regions']
+        )
+        self.assertEqual(
+            _analysis_memo.identify_slowdown_points_cached(self.times),
+            identify_slowdown_points(self.times)
+        )
+    
+    def test_fit_is_shared_across_plots(self):
+        """Test that the plot suite fits the model once."""
+        if not HAS_MATPLOTLIB:
+            self.skipTest("matplotlib not available")
+        with tempfile.TemporaryDirectory() as tmpdir:
+            plot_exponential_fit(self.times, os.path.join(tmpdir, "fit.png"))
+            plot_exponential_fit(dict(self.times), os.path.join(tmpdir, "fit2.png"))
+            plot_slowdown_analysis(self.times, os.path.join(tmpdir, "slowdown.png"))
+            self.assertTrue(os.path.exists(os.path.join(tmpdir, "fit.png")))
+            self.assertTrue(os.path.exists(os.path.join(tmpdir, "slowdown.png")))
+        info = _analysis_memo._cached_fit.cache_info()
+        self.assertEqual(info.misses, 1)
+        self.assertEqual(info.hits, 1)
+    
+    def test_analysis_bundle(self):
+        """Test plots reuse a precomputed analysis bundle."""
+        bundle = build_analysis_bundle(self.times, memory_dimensions=[3, 4, 5, 6, 7, 8])
+        self.assertEqual(bundle['slowdown_points'], identify_slowdown_points(self.times))
+        self.assertEqual(sorted(bundle['memory']), [3, 4, 5, 6, 7, 8])
+        if not HAS_MATPLOTLIB:
+            self.skipTest("matplotlib not available")
+        _analysis_memo.clear_analysis_cache()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            plot_exponential_fit(self.times, os.path.join(tmpdir, "fit.png"), bundle=bundle)
+            plot_slowdown_analysis(self.times, os.path.join(tmpdir, "slowdown.png"), bundle=bundle)
+            plot_memory_vs_dimension(sorted(bundle['memory']), os.path.join(tmpdir, "memory.png"),
+                                     bundle=bundle)
+            for name in ("fit.png", "slowdown.png", "memory.png"):
+                self.assertTrue(os.path.exists(os.path.join(tmpdir, name)))
+        self.assertEqual(_analysis_memo._cached_fit.cache_info().misses, 0)
+        self.assertEqual(_analysis_memo._cached_complexity.cache_info().misses, 0)
+    
+    def test_mismatched_bundle_ignored(self):
+        """Test plots recompute when the bundle came from other inputs."""
+        if not HAS_MATPLOTLIB:
+            self.skipTest("matplotlib not available")
+        from snake_in_box.analysis import exponential_analysis
+        other = build_analysis_bundle({3: 0.002, 4: 0.004, 5: 0.02}, memory_dimensions=[3, 4])
+        _analysis_memo.clear_analysis_cache()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            plot_exponential_fit(self.times, os.path.join(tmpdir, "fit.png"), bundle=other)
+            plot_slowdown_analysis(self.times, os.path.join(tmpdir, "slowdown.png"), bundle=other)
+            self.assertEqual(_analysis_memo._cached_fit.cache_info().misses, 1)
+            self.assertEqual(_analysis_memo._cached_complexity.cache_info().misses, 1)
+            
+            with mock.patch.object(exponential_analysis, 'analyze_memory_complexity',
+                                   wraps=exponential_analysis.analyze_memory_complexity) as memory:
+                plot_memory_vs_dimension([5, 6, 7, 8], os.path.join(tmpdir, "memory.png"),
+                                         bundle=other)
+            memory.assert_called_once_with([5, 6, 7, 8])
+    
+    def test_plot_suite(self):
+        """Test that every plot writes its output file."""
+        if not HAS_MATPLOTLIB:
+            self.skipTest("matplotlib not available")
+        with tempfile.TemporaryDirectory() as tmpdir:
+            time_file = os.path.join(tmpdir, "time.png")
+            memory_file = os.path.join(tmpdir, "memory.png")
+            plot_computation_time_vs_dimension(self.times, time_file)
+            plot_memory_vs_dimension(sorted(self.times), memory_file)
+            self.assertTrue(os.path.exists(time_file))
+            self.assertTrue(os.path.exists(memory_file))
+    
+    def test_ensure_dir(self):
+        """Test output directories are recreated after removal and bare names pass."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            nested = os.path.join(tmpdir, "a", "b")
+            _ensure_dir(os.path.join(nested, "plot.png"))
+            self.assertTrue(os.path.isdir(nested))
+            shutil.rmtree(os.path.join(tmpdir, "a"))
+            _ensure_dir(os.path.join(nested, "plot.png"))
+            self.assertTrue(os.path.isdir(nested))
+            with mock.patch.object(performance_plots.os, 'makedirs') as makedirs:
+                _ensure_dir("plot.png")
+                makedirs.assert_not_called()
+    
+    def test_new_figure_uses_agg_canvas(self):
+        """Test plot figures render on Agg outside pyplot."""
+        if not HAS_MATPLOTLIB:
+            self.skipTest("matplotlib not available")
+        import matplotlib.pyplot as plt
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        before = plt.get_fignums()
+        fig = _new_figure((4, 3))
+        self.assertIsInstance(fig.canvas, FigureCanvasAgg)
+        self.assertEqual(plt.get_fignums(), before)
+    
+    def test_save_fig_skips_unchanged_output(self):
+        """Test that identical renders are not rewritten."""
+        if not HAS_MATPLOTLIB:
+            self.skipTest("matplotlib not available")
+        fig = _new_figure((4, 3))
+        ax = fig.subplots()
+        ax.plot([0, 1], [0, 1])
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "line.png")
+            self.assertTrue(_save_fig(fig, path))
+            self.assertFalse(_save_fig(fig, path))
+            self.assertTrue(_save_fig(fig, path, dpi=50))
+    
+    def test_unchanged_inputs_skip_render(self):
+        """Test that the input-hash sidecar skips up-to-date plots."""
+        if not HAS_MATPLOTLIB:
+            self.skipTest("matplotlib not available")
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output_file = os.path.join(tmpdir, "time.png")
+            plot_computation_time_vs_dimension(self.times, output_file)
+            self.assertTrue(os.path.exists(output_file + ".hash"))
+            with mock.patch.object(performance_plots, '_save_fig') as save:
+                plot_computation_time_vs_dimension(dict(self.times), output_file)
+                save.assert_not_called()
+                plot_computation_time_vs_dimension(self.times, output_file, log_scale=False)
+                save.assert_called_once()
+    
+    def test_lazy_matplotlib_import(self):
+        """Test that non-plotting helpers load without matplotlib."""
+        code = (
+            "import sys\n"
+            "import snake_in_box.utils.performance_plots\n"
+            "from snake_in_box.utils.visualization_helpers import pairwise_projection\n"
+            "print('matplotlib' in sys.modules)"
+        )
+        output = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True, text=True, check=True
+        ).stdout
+        self.assertEqual(output.strip(), "False")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,176 @@
+"""Tests for visualization helper functions."""
+
+import unittest
+import numpy as np
+from snake_in_box.utils import visualization_helpers
+from snake_in_box.utils.visualization_helpers import (
+    get_color_scheme,
+    vertex_bit_matrix,
+    pca_projection,
+    pairwise_projection,
+    force_directed_layout,
+    hypercube_unfolding,
+    apply_styling_bulk,
+    HAS_MATPLOTLIB,
+)
+
+
+class TestVisualizationHelpers(unittest.TestCase):
+    """Test cases for visualization helpers."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.vertices = [0, 1, 3, 7, 6, 14, 30, 28]
+        self.dimension = 5
+    
+    def test_get_color_scheme(self):
+        """Test shared read-only color schemes."""
+        scheme = get_color_scheme('blue')
+        self.assertEqual(scheme['snake_color'], 'blue')
+        self.assertIs(get_color_scheme('blue'), scheme)
+        self.assertIs(get_color_scheme('missing'), get_color_scheme('default'))
+        with self.assertRaises(TypeError):
+            scheme['snake_color'] = 'black'
+    
+    def test_vertex_bit_matrix(self):
+        """Test binary coordinate unpacking."""
+        bits = vertex_bit_matrix(self.vertices, self.dimension)
+        self.assertEqual(bits.shape, (len(self.vertices), self.dimension))
+        for i, vertex in enumerate(self.vertices):
+            for j in range(self.dimension):
+                self.assertEqual(bits[i, j], (vertex >> j) & 1)
+    
+    def test_vertex_bit_matrix_byte_path(self):
+        """Test vertices of at most 8 dimensions unpack bytewise."""
+        vertices = np.arange(256)
+        for dimension in (1, 3, 8):
+            bits = vertex_bit_matrix(vertices % (1 << dimension), dimension)
+            self.assertEqual(bits.shape, (256, dimension))
+            self.assertEqual(bits.dtype, np.uint8)
+            expected = ((vertices % (1 << dimension))[:, None] >> np.arange(dimension)) & 1
+            np.testing.assert_array_equal(bits, expected)
+    
+    def test_vertex_bit_matrix_large(self):
+        """Test both unpacking paths agree on snakes above the kernel cutoff."""
+        np.random.seed(0)
+        vertices = np.random.randint(0, 1 << 40, 5000, dtype=np.int64).astype(np.uint64)
+        expected = (vertices.astype(np.int64)[:, None] >> np.arange(40)) & 1
+        
+        original = visualization_helpers.NUMBA_AVAILABLE
+        for use_numba in sorted({False, original}):
+            try:
+                visualization_helpers.NUMBA_AVAILABLE = use_numba
+                bits = vertex_bit_matrix(vertices, 40)
+            finally:
+                visualization_helpers.NUMBA_AVAILABLE = original
+            self.assertEqual(bits.dtype, np.uint8)
+            np.testing.assert_array_equal(bits, expected)
+    
+    def test_pca_projection_with_bit_matrix(self):
+        """Test PCA with a precomputed binary matrix."""
+        try:
+            expected = pca_projection(self.vertices, self.dimension)
+            bits = vertex_bit_matrix(self.vertices, self.dimension)
+            coords = pca_projection(self.vertices, self.dimension, bit_matrix=bits)
+        except ImportError:
+            self.skipTest("matplotlib not available")
+        self.assertEqual(coords.shape, (len(self.vertices), 2))
+        np.testing.assert_allclose(coords, expected)
+
+    
+    def test_pca_projection_matches_covariance(self):
+        """Test PCA against the covariance eigendecomposition."""
+        visualization_helpers._pca_cache.clear()
+        projection = pca_projection(self.vertices, self.dimension)
+        centered = vertex_bit_matrix(self.vertices, self.dimension).astype(float)
+        centered -= centered.mean(axis=0)
+        eigenvalues, eigenvectors = np.linalg.eigh(np.cov(centered.T))
+        expected = centered @ eigenvectors[:, eigenvalues.argsort()[::-1][:2]]
+        # Principal axes are defined up to sign
+        np.testing.assert_allclose(np.abs(projection), np.abs(expected), atol=1e-12)
+    
+    def test_pca_projection_cached(self):
+        """Test repeated projections return equal, independent arrays."""
+        try:
+            first = pca_projection(self.vertices, self.dimension)
+        except ImportError:
+            self.skipTest("matplotlib not available")
+        first[0, 0] = 99.0
+        second = pca_projection(self.vertices, self.dimension)
+        third = pca_projection(self.vertices, self.dimension)
+        self.assertNotEqual(second[0, 0], 99.0)
+        np.testing.assert_array_equal(second, third)
+        
+        other = pca_projection(self.vertices[:-1], self.dimension)
+        self.assertEqual(other.shape, (len(self.vertices) - 1, 2))
+
+    
+    def test_pairwise_projection(self):
+        """Test projection onto two bit coordinates."""
+        x, y = pairwise_projection(self.vertices, self.dimension, 1, 3)
+        self.assertIsInstance(x, np.ndarray)
+        np.testing.assert_array_equal(x, [(v >> 1) & 1 for v in self.vertices])
+        np.testing.assert_array_equal(y, [(v >> 3) & 1 for v in self.vertices])
+    
+    def test_force_directed_layout(self):
+        """Test layout kernels match a pairwise reference loop."""
+        n = len(self.vertices)
+        np.random.seed(0)
+        pos = np.random.rand(n, 2) * 10
+        k = np.sqrt(100.0 / n)
+        for _ in range(5):
+            forces = np.zeros((n, 2))
+            for i in range(n):
+                for j in range(n):
+                    if i != j:
+                        diff = pos[i] - pos[j]
+                        forces[i] += k * k * diff / np.dot(diff, diff)
+                    if abs(i - j) == 1:
+                        forces[i] += (pos[j] - pos[i]) / k
+            pos += 0.1 * forces
+            pos -= np.mean(pos, axis=0)
+        
+        original = (
+            visualization_helpers._LAYOUT_BLOCK_ROWS,
+            visualization_helpers.NUMBA_AVAILABLE,
+        )
+        # Check the NumPy path, and the Numba kernel when installed
+        for use_numba in sorted({False, original[1]}):
+            try:
+                # Small blocks exercise the row-blocked repulsion
+                visualization_helpers._LAYOUT_BLOCK_ROWS = 3
+                visualization_helpers.NUMBA_AVAILABLE = use_numba
+                np.random.seed(0)
+                layout = force_directed_layout(self.vertices, self.dimension, iterations=5)
+            finally:
+                (visualization_helpers._LAYOUT_BLOCK_ROWS,
+                 visualization_helpers.NUMBA_AVAILABLE) = original
+            np.testing.assert_allclose(layout, pos)
+    
+    def test_hypercube_unfolding(self):
+        """Test unfolding matches interleaved-bit coordinates."""
+        pos = hypercube_unfolding(self.vertices, self.dimension)
+        expected = np.zeros((len(self.vertices), 2))
+        for i, vertex in enumerate(self.vertices):
+            for j in range(self.dimension):
+                expected[i, j % 2] += ((vertex >> j) & 1) * 2 ** (j // 2)
+        expected = expected / expected.max() * 10
+        np.testing.assert_allclose(pos, expected)
+    
+    def test_apply_styling_bulk(self):
+        """Test styling several axes in one pass."""
+        if not HAS_MATPLOTLIB:
+            self.skipTest("matplotlib not available")
+        from matplotlib.colors import to_rgba
+        from matplotlib.figure import Figure
+        axes = list(Figure().subplots(1, 2))
+        scheme = get_color_scheme('blue')
+        apply_styling_bulk(axes, ['A', 'B'], scheme)
+        self.assertEqual([ax.get_title() for ax in axes], ['A', 'B'])
+        for ax in axes:
+            self.assertEqual(ax.get_facecolor(), to_rgba(scheme['background_color']))
+            self.assertTrue(ax.xaxis.get_gridlines()[0].get_visible())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -2,6 +2,10 @@
 
 import unittest
 import os
+import subprocess
+import sys
+import tempfile
+import numpy as np
 from snake_in_box.core.snake_node import SnakeNode
 from snake_in_box.utils.visualize_advanced import (
     visualize_snake_1d,
@@ -9,6 +13,11 @@ from snake_in_box.utils.visualize_advanced import (
     visualize_snake_3d_advanced,
     visualize_snake_nd,
     visualize_snake_auto,
+    visualize_snake_heatmap,
+    visualize_snake_3d_projection,
+    visualize_snake_transition_matrix,
+    visualize_many,
+    _vertices_and_bits,
 )
 
 
@@ -42,26 +51,36 @@ class TestVisualizeAdvanced(unittest.TestCase):
             self.skipTest("matplotlib not available")
     
     def test_visualize_snake_2d(self):
-        """Test 2D visualization."""
+        """Test 2D visualization draws the path as one rasterized collection."""
         try:
             fig = visualize_snake_2d(self.node_2d, show_plot=False)
-            self.assertIsNotNone(fig)
-            if fig:
-                import matplotlib.pyplot as plt
-                plt.close(fig)
         except ImportError:
             self.skipTest("matplotlib not available")
+        from matplotlib.collections import LineCollection
+        ax = fig.axes[0]
+        paths = [c for c in ax.collections if isinstance(c, LineCollection)]
+        self.assertEqual(len(paths), 1)
+        self.assertTrue(paths[0].get_rasterized())
+        segments = paths[0].get_segments()
+        self.assertEqual(len(segments), 2)
+        self.assertEqual(segments[0].tolist(), [[0, 0], [1, 0]])
+        self.assertEqual(segments[1].tolist(), [[1, 0], [1, 1]])
+        import matplotlib.pyplot as plt
+        plt.close(fig)
     
     def test_visualize_snake_3d_advanced(self):
-        """Test 3D visualization."""
+        """Test 3D visualization draws the cube as one collection."""
         try:
             fig = visualize_snake_3d_advanced(self.node_3d, show_plot=False)
-            self.assertIsNotNone(fig)
-            if fig:
-                import matplotlib.pyplot as plt
-                plt.close(fig)
         except ImportError:
             self.skipTest("matplotlib not available")
+        fig.canvas.draw()
+        ax = fig.axes[0]
+        self.assertEqual(len(ax.lines), 1)
+        self.assertEqual(len(ax.collections), 1)
+        self.assertEqual(len(ax.collections[0].get_segments()), 12)
+        import matplotlib.pyplot as plt
+        plt.close(fig)
     
     def test_visualize_snake_nd(self):
         """Test N-dimensional visualization."""
@@ -98,6 +117,209 @@ class TestVisualizeAdvanced(unittest.TestCase):
                 plt.close(fig)
         except ImportError:
             self.skipTest("matplotlib not available")
+    
+    def test_visualize_snake_heatmap(self):
+        """Test heatmap shows each vertex's bits."""
+        try:
+            fig = visualize_snake_heatmap(self.node_4d, show_plot=False)
+        except ImportError:
+            self.skipTest("matplotlib not available")
+        image = fig.axes[0].get_images()[0].get_array()
+        self.assertEqual(image.dtype, np.uint8)
+        vertices = [0, 1, 3, 7, 6, 4]
+        self.assertEqual(image.shape, (len(vertices), 4))
+        for i, vertex in enumerate(vertices):
+            for j in range(4):
+                self.assertEqual(image[i, j], (vertex >> j) & 1)
+        import matplotlib.pyplot as plt
+        plt.close(fig)
+    
+    def test_visualize_snake_3d_projection(self):
+        """Test 3D PCA projection draws a gradient path of segments."""
+        try:
+            fig = visualize_snake_3d_projection(self.node_4d, show_plot=False)
+        except ImportError:
+            self.skipTest("matplotlib not available")
+        from mpl_toolkits.mplot3d.art3d import Line3DCollection
+        paths = [c for c in fig.axes[0].collections
+                 if isinstance(c, Line3DCollection)]
+        self.assertEqual(len(paths), 1)
+        self.assertEqual(len(paths[0].get_array()), 5)
+        points = [c for c in fig.axes[0].collections if c not in paths][0]
+        self.assertEqual(points.get_array().tolist(), [0, 1, 2, 3, 4, 5])
+        self.assertEqual(points.get_cmap().name, 'viridis')
+        import matplotlib.pyplot as plt
+        plt.close(fig)
+    
+    def test_visualize_snake_3d_projection_short(self):
+        """Test short snakes skip PCA and draw their centered bits."""
+        from unittest import mock
+        from snake_in_box.utils import visualize_advanced
+        short_node = SnakeNode([0, 1, 2], 5)
+        with mock.patch.object(visualize_advanced, 'pca_projection') as pca:
+            try:
+                fig = visualize_snake_3d_projection(short_node, show_plot=False)
+            except ImportError:
+                self.skipTest("matplotlib not available")
+        pca.assert_not_called()
+        # Vertices 0, 1, 3, 7: bit 0 is 0, 1, 1, 1, centered on 0.75
+        np.testing.assert_allclose(fig.axes[0].xy_dataLim.intervalx, [-0.75, 0.25])
+        import matplotlib.pyplot as plt
+        plt.close(fig)
+        
+        with mock.patch.object(visualize_advanced, 'pca_projection',
+                               wraps=visualize_advanced.pca_projection) as pca:
+            fig = visualize_snake_3d_projection(self.node_4d, show_plot=False)
+        pca.assert_called_once()
+        plt.close(fig)
+    
+    def test_visualize_snake_3d_projection_dense(self):
+        """Test long snakes get rasterized points and honour max_points."""
+        long_node = SnakeNode([i % 4 for i in range(6000)], 4)
+        try:
+            fig = visualize_snake_3d_projection(long_node, show_plot=False)
+        except ImportError:
+            self.skipTest("matplotlib not available")
+        from mpl_toolkits.mplot3d.art3d import Line3DCollection
+        import matplotlib.pyplot as plt
+        collections = fig.axes[0].collections
+        self.assertTrue(all(c.get_rasterized() for c in collections))
+        plt.close(fig)
+        
+        fig = visualize_snake_3d_projection(long_node, show_plot=False, max_points=100)
+        path = [c for c in fig.axes[0].collections
+                if isinstance(c, Line3DCollection)][0]
+        self.assertLessEqual(len(path.get_array()), 99)
+        self.assertFalse(path.get_rasterized())
+        plt.close(fig)
+    
+    def test_visualize_snake_transition_matrix(self):
+        """Test transition matrix marks the dimension used at each step."""
+        try:
+            fig = visualize_snake_transition_matrix(self.node_4d, show_plot=False)
+        except ImportError:
+            self.skipTest("matplotlib not available")
+        image = fig.axes[0].get_images()[0].get_array()
+        transitions = self.node_4d.transition_sequence
+        self.assertEqual(image.dtype, np.uint8)
+        self.assertEqual(image.shape, (4, len(transitions)))
+        for i, trans in enumerate(transitions):
+            self.assertEqual(image[:, i].sum(), 1)
+            self.assertEqual(image[trans, i], 1)
+        import matplotlib.pyplot as plt
+        plt.close(fig)
+
+    
+    def test_matrix_views_downsample(self):
+        """Test long snakes are decimated unless downsample is False."""
+        long_node = SnakeNode([i % 4 for i in range(20000)], 4)
+        try:
+            fig = visualize_snake_heatmap(long_node, show_plot=False)
+        except ImportError:
+            self.skipTest("matplotlib not available")
+        import matplotlib.pyplot as plt
+        ax = fig.axes[0]
+        self.assertLess(ax.get_images()[0].get_array().shape[0], 20001)
+        self.assertEqual(ax.get_ylim(), (20000.5, -0.5))
+        plt.close(fig)
+        
+        fig = visualize_snake_transition_matrix(long_node, show_plot=False)
+        self.assertLess(fig.axes[0].get_images()[0].get_array().shape[1], 20000)
+        plt.close(fig)
+        
+        fig = visualize_snake_transition_matrix(
+            self.node_4d, show_plot=False, downsample=False
+        )
+        self.assertEqual(fig.axes[0].get_images()[0].get_array().shape, (4, 5))
+        plt.close(fig)
+    
+    def test_hidden_figures_skip_pyplot(self):
+        """Test show_plot=False figures are not registered with pyplot."""
+        try:
+            import matplotlib.pyplot as plt
+        except ImportError:
+            self.skipTest("matplotlib not available")
+        before = plt.get_fignums()
+        figures = [
+            visualize_snake_auto(self.node_3d, show_plot=False),
+            visualize_snake_nd(self.node_4d, show_plot=False),
+            visualize_snake_heatmap(self.node_4d, show_plot=False),
+            visualize_snake_3d_projection(self.node_4d, show_plot=False),
+        ]
+        self.assertEqual(plt.get_fignums(), before)
+        for fig in figures:
+            fig.canvas.draw()
+            self.assertEqual(fig.canvas.get_default_filetype(), 'png')
+    
+    def test_visualize_many(self):
+        """Test batch rendering writes one PNG per snake in order."""
+        nodes = [self.node_2d, self.node_3d, self.node_4d]
+        with tempfile.TemporaryDirectory() as tmpdir:
+            out_dir = os.path.join(tmpdir, 'batch')
+            try:
+                paths = visualize_many(nodes, output_dir=out_dir, max_workers=2, dpi=30)
+            except ImportError:
+                self.skipTest("matplotlib not available")
+            self.assertEqual([os.path.basename(p) for p in paths],
+                             ['000000.png', '000001.png', '000002.png'])
+            for path in paths:
+                with open(path, 'rb') as f:
+                    self.assertEqual(f.read(8), b'\x89PNG\r\n\x1a\n')
+            
+            paths = visualize_many(nodes[2:], kind='heatmap', output_dir=out_dir,
+                                   max_workers=1, dpi=30)
+            self.assertTrue(os.path.exists(paths[0]))
+        
+        with self.assertRaises(ValueError):
+            visualize_many(nodes, kind='unknown')
+    
+    def test_hidden_views_skip_pyplot_import(self):
+        """Test headless renders never import pyplot."""
+        code = (
+            "import sys\n"
+            "from snake_in_box.core.snake_node import SnakeNode\n"
+            "from snake_in_box.utils import visualize_advanced as va\n"
+            "loaded = 'matplotlib.pyplot' in sys.modules\n"
+            "node = SnakeNode([0, 1, 2, 0, 1], 4)\n"
+            "va.visualize_snake_nd(node, show_plot=False)\n"
+            "va.visualize_snake_heatmap(node, show_plot=False)\n"
+            "print(loaded, 'matplotlib.pyplot' in sys.modules)"
+        )
+        output = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True, text=True, check=True
+        ).stdout
+        self.assertEqual(output.strip(), "False False")
+    
+    def test_configure_headless(self):
+        """Test configure_headless selects the Agg backend."""
+        code = (
+            "import matplotlib\n"
+            "from snake_in_box.utils import configure_headless\n"
+            "configure_headless()\n"
+            "print(matplotlib.get_backend().lower())"
+        )
+        try:
+            output = subprocess.run(
+                [sys.executable, "-c", code],
+                capture_output=True, text=True, check=True
+            ).stdout
+        except subprocess.CalledProcessError:
+            self.skipTest("matplotlib not available")
+        self.assertEqual(output.strip(), "agg")
+    
+    def test_vertices_and_bits_cache(self):
+        """Test repeat views of a snake share its vertex arrays."""
+        vertices, bits = _vertices_and_bits(self.node_4d)
+        self.assertEqual(vertices.tolist(), [0, 1, 3, 7, 6, 4])
+        self.assertEqual(bits.shape, (6, 4))
+        self.assertEqual(bits[3].tolist(), [1, 1, 1, 0])
+        self.assertFalse(vertices.flags.writeable)
+        
+        same = SnakeNode([0, 1, 2, 0, 1], 4)
+        self.assertIs(_vertices_and_bits(same)[1], bits)
+        other = SnakeNode([0, 1, 2, 0, 1], 5)
+        self.assertIsNot(_vertices_and_bits(other)[1], bits)
 
 
 if __name__ == '__main__':
@@ -1,34 +1,58 @@
-from .canonical import is_canonical, get_legal_next_dimensions
-from .export import export_snake, export_analysis_data
-from .visualize import visualize_snake_3d
-from .visualize_advanced import (
-    visualize_snake_auto,
-    visualize_snake_heatmap,
-    visualize_snake_3d_projection,
-    visualize_snake_transition_matrix,
-)
-from .graphical_abstract import generate_16d_panel
-from .performance_plots import (
-    plot_computation_time_vs_dimension,
-    plot_exponential_fit,
-    plot_slowdown_analysis,
-    plot_memory_vs_dimension,
-)
+from importlib import import_module
+
+from .canonical import is_canonical, get_legal_next_dimensions, canonical_state
+from .export import export_snake, export_analysis_data, AnalysisTable, Method
+
+# Plotting modules import matplotlib, so they load on first attribute access
+_LAZY_ATTRIBUTES = {
+    "visualize_snake_3d": "visualize",
+    "visualize_snake_auto": "visualize_advanced",
+    "visualize_snake_heatmap": "visualize_advanced",
+    "visualize_snake_3d_projection": "visualize_advanced",
+    "visualize_snake_transition_matrix": "visualize_advanced",
+    "visualize_many": "visualize_advanced",
+    "generate_16d_panel": "graphical_abstract",
+    "plot_computation_time_vs_dimension": "performance_plots",
+    "plot_exponential_fit": "performance_plots",
+    "plot_slowdown_analysis": "performance_plots",
+    "plot_memory_vs_dimension": "performance_plots",
+    "build_analysis_bundle": "performance_plots",
+    "configure_headless": "visualization_helpers",
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_ATTRIBUTES:
+        module = import_module(f".{_LAZY_ATTRIBUTES[name]}", __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
+
 
 __all__ = [
     "is_canonical",
     "get_legal_next_dimensions",
+    "canonical_state",
     "export_snake",
     "export_analysis_data",
+    "AnalysisTable",
+    "Method",
     "visualize_snake_3d",
     "visualize_snake_auto",
     "visualize_snake_heatmap",
     "visualize_snake_3d_projection",
     "visualize_snake_transition_matrix",
+    "visualize_many",
     "generate_16d_panel",
     "plot_computation_time_vs_dimension",
     "plot_exponential_fit",
     "plot_slowdown_analysis",
     "plot_memory_vs_dimension",
+    "build_analysis_bundle",
+    "configure_headless",
 ]
-
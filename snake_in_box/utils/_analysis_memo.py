@@ -0,0 +1,64 @@
+"""Memoized timing analysis shared by the performance plots.
+
+The plot functions in :mod:`performance_plots` each analyse the same
+``times`` dictionary. These wrappers key the analysis on a sorted tuple of
+its items so that producing the full plot suite fits the model once.
+
+The returned dictionaries are shared between callers and must be treated
+as read-only.
+"""
+
+from functools import lru_cache
+from typing import Dict, List, Tuple
+
+
+def _times_key(times: Dict[int, float]) -> Tuple[Tuple[int, float], ...]:
+    """Return a hashable view of a dimension-to-time mapping."""
+    return tuple(sorted(times.items()))
+
+
+@lru_cache(maxsize=32)
+def _cached_fit(times_items: Tuple[Tuple[int, float], ...]) -> Dict:
+    # Lazy import to avoid circular dependency
+    from ..analysis.exponential_analysis import fit_exponential_model
+    return fit_exponential_model(dict(times_items))
+
+
+@lru_cache(maxsize=32)
+def _cached_complexity(times_items: Tuple[Tuple[int, float], ...]) -> Dict:
+    from ..analysis.exponential_analysis import analyze_computation_complexity
+    return analyze_computation_complexity(dict(times_items))
+
+
+@lru_cache(maxsize=32)
+def _cached_slowdown_points(
+    times_items: Tuple[Tuple[int, float], ...],
+    threshold: float = 2.0
+) -> Tuple[int, ...]:
+    from ..analysis.exponential_analysis import identify_slowdown_points
+    return tuple(identify_slowdown_points(dict(times_items), threshold))
+
+
+def fit_exponential_model_cached(times: Dict[int, float]) -> Dict:
+    """Memoized :func:`fit_exponential_model`."""
+    return _cached_fit(_times_key(times))
+
+
+def analyze_computation_complexity_cached(times: Dict[int, float]) -> Dict:
+    """Memoized :func:`analyze_computation_complexity`."""
+    return _cached_complexity(_times_key(times))
+
+
+def identify_slowdown_points_cached(
+    times: Dict[int, float],
+    threshold: float = 2.0
+) -> List[int]:
+    """Memoized :func:`identify_slowdown_points`."""
+    return list(_cached_slowdown_points(_times_key(times), threshold))
+
+
+def clear_analysis_cache() -> None:
+    """Clear all memoized analysis results."""
+    _cached_fit.cache_clear()
+    _cached_complexity.cache_clear()
+    _cached_slowdown_points.cache_clear()
@@ -0,0 +1,37 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""Compiled canonical-form check.
+
+Optional C extension built from this file when Cython is available at
+install time. ``canonical.py`` falls back to Numba or pure Python when
+the extension is not importable.
+"""
+
+from libc.stdint cimport int64_t
+
+
+def is_canonical_c(const int64_t[::1] sequence):
+    """Check Kochut's canonical form over a contiguous int64 buffer.
+    
+    Parameters
+    ----------
+    sequence : np.ndarray
+        Contiguous int64 transition sequence
+    
+    Returns
+    -------
+    bool
+        True if sequence is in canonical form, False otherwise
+    """
+    cdef Py_ssize_t i, n = sequence.shape[0]
+    cdef int64_t dim
+    # Starting at -1 folds the first-digit rule into dim <= max + 1
+    cdef int64_t max_dimension = -1
+    
+    for i in range(n):
+        dim = sequence[i]
+        if dim > max_dimension + 1:
+            return False
+        if dim > max_dimension:
+            max_dimension = dim
+    
+    return True
@@ -0,0 +1,22 @@
+"""Optional Numba JIT support.
+
+Numba is an optional dependency. When it is not installed, ``njit`` is a
+no-op decorator and callers should keep using their pure-Python paths,
+which ``NUMBA_AVAILABLE`` lets them select.
+"""
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """Fallback decorator returning the function unchanged."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+__all__ = ["njit", "prange", "NUMBA_AVAILABLE"]
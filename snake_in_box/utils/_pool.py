@@ -0,0 +1,18 @@
+"""Multiprocessing context shared by the package's worker pools."""
+
+import multiprocessing
+
+
+def spawn_context() -> multiprocessing.context.BaseContext:
+    """Return the multiprocessing context used for worker pools.
+    
+    A forked child copies only the thread that called fork. Any lock held
+    by another thread at that moment, such as one in a BLAS or OpenMP
+    thread pool or in a thread the caller started, stays locked in the
+    child forever, so the worker can hang on first use. Spawned workers
+    start a fresh interpreter and inherit no threads.
+    """
+    return multiprocessing.get_context('spawn')
+
+
+__all__ = ["spawn_context"]
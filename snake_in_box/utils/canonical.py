@@ -1,6 +1,71 @@
 """Canonical form utilities for symmetry reduction."""
 
 from typing import List
+import numpy as np
+from ..core.transitions import CanonicalState
+
+try:
+    # Optional C extension built from _canonical.pyx (see setup.py)
+    from ._canonical import is_canonical_c as _is_canonical_ext
+except ImportError:
+    _is_canonical_ext = None
+
+# Shorter sequences are checked in Python; converting them to an array
+# costs more than the interpreted loop
+_JIT_MIN_LENGTH = 64
+
+
+def _is_canonical_scan(sequence) -> bool:
+    """Single-pass canonical check over a list or int64 array."""
+    if len(sequence) == 0:
+        return True
+    
+    # First digit must be 0
+    if sequence[0] != 0:
+        return False
+    
+    # Track maximum dimension used so far
+    max_dimension = 0
+    
+    for i in range(len(sequence)):
+        dim = sequence[i]
+        # Each digit must be ≤ max_dimension + 1
+        if dim > max_dimension + 1:
+            return False
+        
+        # Update max_dimension if we've introduced a new dimension
+        if dim == max_dimension + 1:
+            max_dimension = dim
+    
+    return True
+
+
+def _is_canonical_branchless(sequence) -> bool:
+    """Branch-free canonical check for the compiled path.
+    
+    Starting the running maximum at -1 folds the first-digit rule into
+    the general ``dim <= max + 1`` test, so the loop body is a compare,
+    an OR and a conditional move with no data-dependent branches.
+    """
+    violation = False
+    max_dimension = -1
+    for i in range(len(sequence)):
+        dim = sequence[i]
+        violation |= dim > max_dimension + 1
+        max_dimension = dim if dim > max_dimension else max_dimension
+    return not violation
+
+
+# The Numba fallback is only imported and compiled when the extension is
+# missing, so installs with the extension never load Numba here
+_is_canonical_jit = None
+if _is_canonical_ext is None:
+    from ._jit import njit, NUMBA_AVAILABLE
+    if NUMBA_AVAILABLE:
+        # Signature pinned so compilation happens at import (cached on disk)
+        _is_canonical_jit = njit("boolean(int64[::1])", cache=True, nogil=True)(
+            _is_canonical_branchless
+        )
 
 
 def is_canonical(transition_sequence: List[int]) -> bool:
@@ -13,9 +78,12 @@ def is_canonical(transition_sequence: List[int]) -> bool:
     This ensures exactly one representative from each equivalence class
     of snakes related by hypercube symmetries.
     
+    Long sequences are checked by a compiled kernel: the Cython extension
+    when it was built at install time, otherwise Numba when installed.
+    
     Parameters
     ----------
-    transition_sequence : List[int]
+    transition_sequence : List[int] or np.ndarray
         Transition sequence to check
     
     Returns
@@ -32,26 +100,15 @@ def is_canonical(transition_sequence: List[int]) -> bool:
     >>> is_canonical([0, 1, 3])  # 3 > max(0,1) + 1 = 2
     False
     """
-    if not transition_sequence:
-        return True
-    
-    # First digit must be 0
-    if transition_sequence[0] != 0:
-        return False
-    
-    # Track maximum dimension used so far
-    max_dimension = 0
-    
-    for i, dim in enumerate(transition_sequence):
-        # Each digit must be ≤ max_dimension + 1
-        if dim > max_dimension + 1:
-            return False
-        
-        # Update max_dimension if we've introduced a new dimension
-        if dim == max_dimension + 1:
-            max_dimension = dim
-    
-    return True
+    if len(transition_sequence) >= _JIT_MIN_LENGTH:
+        if _is_canonical_ext is not None:
+            array = np.ascontiguousarray(transition_sequence, dtype=np.int64)
+            return _is_canonical_ext(array)
+        if _is_canonical_jit is not None:
+            array = np.ascontiguousarray(transition_sequence, dtype=np.int64)
+            return bool(_is_canonical_jit(array))
+    
+    return _is_canonical_scan(transition_sequence)
 
 
 def get_legal_next_dimensions(transition_sequence: List[int]) -> List[int]:
@@ -86,15 +143,40 @@ def get_legal_next_dimensions(transition_sequence: List[int]) -> List[int]:
         # Empty sequence: first transition must be 0
         return [0]
     
-    # Get maximum dimension used
-    max_dim = max(transition_sequence)
-    
-    # Can use any previously used dimension or introduce max_dim + 1
-    legal = list(set(transition_sequence))  # Unique previously used dimensions
-    legal.append(max_dim + 1)  # Can introduce next dimension
+    used = set(transition_sequence)
+    max_dim = max(used)
     
-    # Sort for consistency
-    legal.sort()
+    # Canonical prefixes use every dimension up to max_dim, so the legal
+    # set is a plain range and needs no sorting
+    if len(used) == max_dim + 1:
+        return list(range(max_dim + 2))
     
-    return legal
+    # Otherwise: any previously used dimension or max_dim + 1
+    used.add(max_dim + 1)
+    return sorted(used)
 
+
+def canonical_state(transition_sequence: List[int]) -> CanonicalState:
+    """Compute canonical-form status and legal-extension data in one pass.
+    
+    Replaces a separate ``is_canonical`` plus ``get_legal_next_dimensions``
+    scan of the same prefix. The returned state can then be advanced with
+    ``CanonicalState.extend`` as transitions are appended.
+    
+    Parameters
+    ----------
+    transition_sequence : List[int]
+        Transition sequence to summarize
+    
+    Returns
+    -------
+    CanonicalState
+        State with ``is_canonical``, ``max_dim`` and ``used_mask``
+    
+    Examples
+    --------
+    >>> state = canonical_state([0, 1, 0, 2])
+    >>> state.is_canonical, state.legal_next_dimensions()
+    (True, [0, 1, 2, 3])
+    """
+    return CanonicalState.from_sequence(transition_sequence)
@@ -1,17 +1,76 @@
 """Export functions for snake results."""
 
+import io
 import json
 import csv
-from typing import Optional, Dict, List, Any
+import os
+import tarfile
+from enum import IntEnum
+from pathlib import Path
+from typing import Optional, Dict, List, Any, Tuple, Union
 from datetime import datetime
+import numpy as np
 from ..core.snake_node import SnakeNode
-from ..core.transitions import transition_to_vertex
+from ..core.transitions import transition_to_vertex_array
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# One ASCII digit per transition: 0-9 then a, b, c, ... (paper format)
+_HEX_TABLE = np.frombuffer(b'0123456789abcdefghijklmnopqrstuvwxyz', dtype='S1')
+
+
+def _dumps_json(data: Any) -> bytes:
+    """Serialize data as indented UTF-8 JSON, using orjson when installed.
+    
+    Both paths write non-ASCII text unescaped and parse back to the same
+    values, but the bytes can differ: orjson spells exponents as ``1e16``
+    rather than ``1e+16`` and writes NaN and infinities as ``null``, where
+    the stdlib encoder writes ``NaN`` and ``Infinity``.
+    """
+    if orjson is not None:
+        option = (
+            orjson.OPT_INDENT_2
+            | orjson.OPT_NON_STR_KEYS
+            | orjson.OPT_SERIALIZE_NUMPY
+        )
+        return orjson.dumps(data, option=option)
+    return json.dumps(
+        data, indent=2, ensure_ascii=False, default=_json_default
+    ).encode('utf-8')
+
+
+def _json_default(obj: Any) -> Any:
+    """Convert NumPy arrays for the stdlib JSON encoder."""
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _write_json(data: Any, path: str) -> None:
+    """Write data as indented JSON, using orjson when installed."""
+    with open(path, 'wb') as f:
+        f.write(_dumps_json(data))
+
+
+def _hex_encode_bytes(transition_sequence: List[int]) -> bytes:
+    """Encode transitions as ASCII digit bytes with one table gather."""
+    indices = np.asarray(transition_sequence, dtype=np.intp)
+    return _HEX_TABLE[indices].tobytes()
+
+
+def _hex_encode(transition_sequence: List[int]) -> str:
+    """Encode transitions as a digit string with one table gather."""
+    return _hex_encode_bytes(transition_sequence).decode('ascii')
 
 
 def export_snake(
     snake_node: SnakeNode,
     filename: str,
-    include_vertices: bool = True
+    include_vertices: bool = True,
+    archive: bool = False
 ) -> None:
     """Export snake to file in multiple formats.
     
@@ -19,6 +78,9 @@ def export_snake(
     - JSON file with full metadata
     - Text file with comma-separated transition sequence (paper format)
     
+    With ``archive=True`` the same files are written as members of a
+    single ``<filename>.tar`` archive instead.
+    
     Parameters
     ----------
     snake_node : SnakeNode
@@ -27,6 +89,8 @@ def export_snake(
         Base filename (without extension)
     include_vertices : bool, optional
         Include vertex sequence in JSON (default: True)
+    archive : bool, optional
+        Write all formats into one tar archive (default: False)
     
     Examples
     --------
@@ -43,34 +107,213 @@ def export_snake(
     }
     
     if include_vertices:
-        data['vertex_sequence'] = transition_to_vertex(
+        # Kept as an array so orjson serializes it without boxing each vertex
+        data['vertex_sequence'] = transition_to_vertex_array(
             snake_node.transition_sequence,
             snake_node.dimension
         )
     
-    # Export JSON
     json_filename = filename if filename.endswith('.json') else filename + '.json'
-    with open(json_filename, 'w') as f:
-        json.dump(data, f, indent=2)
-    
-    # Export text format (comma-separated transitions, paper format)
     txt_filename = filename if filename.endswith('.txt') else filename + '.txt'
-    with open(txt_filename, 'w') as f:
-        # Convert to hex string format (0-9, a-f)
-        hex_string = ''.join(
-            format(t, 'x') if t < 10 else chr(ord('a') + t - 10)
-            for t in snake_node.transition_sequence
-        )
-        f.write(hex_string)
+    csv_filename = filename + '_comma.txt'
+    
+    # Text payloads are built as ASCII bytes and written in binary mode
+    hex_bytes = _hex_encode_bytes(snake_node.transition_sequence)
+    comma_bytes = ','.join(map(str, snake_node.transition_sequence)).encode('ascii')
+    
+    if archive:
+        base = os.path.splitext(filename)[0] if filename.endswith(('.json', '.txt')) else filename
+        members = [
+            (json_filename, _dumps_json(data)),
+            (txt_filename, hex_bytes),
+            (csv_filename, comma_bytes),
+        ]
+        with tarfile.open(base + '.tar', 'w') as tar:
+            for member_name, payload in members:
+                info = tarfile.TarInfo(os.path.basename(member_name))
+                info.size = len(payload)
+                tar.addfile(info, io.BytesIO(payload))
+        return
+    
+    # Export JSON
+    _write_json(data, json_filename)
+    
+    # Export text format (hex string format 0-9, a-f; paper format)
+    Path(txt_filename).write_bytes(hex_bytes)
     
     # Also export comma-separated format
-    csv_filename = filename + '_comma.txt'
-    with open(csv_filename, 'w') as f:
-        f.write(','.join(map(str, snake_node.transition_sequence)))
+    Path(csv_filename).write_bytes(comma_bytes)
+
+
+class Method(IntEnum):
+    """Integer codes for the result ``method`` strings.
+    
+    ``AnalysisTable`` stores methods as these codes so counts are a
+    single ``np.bincount``. Methods outside this set get codes after
+    ``PRIMING`` in the order they are first seen.
+    """
+    
+    UNKNOWN = 0
+    KNOWN = 1
+    SEARCH = 2
+    PRIMING = 3
+
+
+class AnalysisTable:
+    """Column-oriented analysis results.
+    
+    Holds one NumPy array per summary field, with rows sorted by
+    dimension, so statistics over many results are array reductions
+    instead of per-dict lookups.
+    
+    Attributes
+    ----------
+    dims : np.ndarray
+        Dimension of each row (int64)
+    length : np.ndarray
+        Snake length (int64)
+    valid : np.ndarray
+        Validation flag (bool)
+    method : np.ndarray
+        Method code (int64), a ``Method`` value or an index past it
+    method_names : Tuple[str, ...]
+        Method name for each code, starting with the ``Method`` members
+    fitness : np.ndarray
+        Fitness value as given, integer or float (object)
+    time_s : np.ndarray
+        Computation time in seconds (float64)
+    time_h : np.ndarray
+        Computation time in hours (float64)
+    known_record : np.ndarray
+        Known record length, or None when unknown (object)
+    matches_known : np.ndarray
+        Whether the length matches the known record (bool)
+    """
+    
+    __slots__ = (
+        'dims', 'length', 'valid', 'method', 'method_names', 'fitness',
+        'time_s', 'time_h', 'known_record', 'matches_known',
+    )
+    
+    def __init__(
+        self,
+        dims,
+        length,
+        valid,
+        method,
+        fitness,
+        time_s,
+        time_h,
+        known_record,
+        matches_known
+    ):
+        self.dims = np.asarray(dims, dtype=np.int64)
+        self.length = np.asarray(length, dtype=np.int64)
+        self.valid = np.asarray(valid, dtype=bool)
+        # Encode method names as codes, appending names not in Method
+        codes = {member.name.lower(): member.value for member in Method}
+        self.method = np.fromiter(
+            (codes.setdefault(name, len(codes)) for name in method),
+            dtype=np.int64,
+            count=len(method)
+        )
+        self.method_names = tuple(codes)
+        self.fitness = np.asarray(fitness, dtype=object)
+        self.time_s = np.asarray(time_s, dtype=np.float64)
+        self.time_h = np.asarray(time_h, dtype=np.float64)
+        self.known_record = np.asarray(known_record, dtype=object)
+        self.matches_known = np.asarray(matches_known, dtype=bool)
+    
+    @classmethod
+    def from_dict(cls, results: Dict[int, Dict]) -> 'AnalysisTable':
+        """Build a table from a dimension -> result dict mapping.
+        
+        Parameters
+        ----------
+        results : Dict[int, Dict]
+            Analysis results dictionary mapping dimension to result data
+        
+        Returns
+        -------
+        AnalysisTable
+            Table with one row per dimension, sorted by dimension
+        """
+        rows = [results[dim] for dim in sorted(results)]
+        return cls(
+            dims=sorted(results),
+            length=[r.get('length', 0) for r in rows],
+            valid=[r.get('is_valid', False) for r in rows],
+            method=[r.get('method', 'unknown') for r in rows],
+            fitness=[r.get('fitness', 0) for r in rows],
+            time_s=[r.get('computation_time_seconds', 0.0) for r in rows],
+            time_h=[r.get('computation_time_hours', 0.0) for r in rows],
+            known_record=[r.get('known_record') for r in rows],
+            matches_known=[r.get('matches_known', False) for r in rows],
+        )
+    
+    def __len__(self) -> int:
+        return len(self.dims)
+    
+    def to_dict(self) -> Dict[int, Dict]:
+        """Convert back to a dimension -> result dict mapping."""
+        return {
+            dim: {
+                'length': length,
+                'is_valid': valid,
+                'method': method,
+                'fitness': fitness,
+                'computation_time_seconds': time_s,
+                'computation_time_hours': time_h,
+                'known_record': known_record,
+                'matches_known': matches_known,
+            }
+            for dim, length, valid, method, fitness, time_s, time_h,
+                known_record, matches_known in self.rows()
+        }
+    
+    def rows(self) -> List[Tuple]:
+        """Rows in CSV column order, as Python scalars."""
+        return list(zip(
+            self.dims.tolist(),
+            self.length.tolist(),
+            self.valid.tolist(),
+            [self.method_names[code] for code in self.method.tolist()],
+            self.fitness.tolist(),
+            self.time_s.tolist(),
+            self.time_h.tolist(),
+            self.known_record.tolist(),
+            self.matches_known.tolist(),
+        ))
+    
+    def statistics(self) -> Dict[str, Any]:
+        """Summary statistics computed with array reductions.
+        
+        Returns
+        -------
+        Dict[str, Any]
+            Counts by validity and method, total and average length, and
+            total computation time
+        """
+        n = len(self)
+        valid = int(self.valid.sum())
+        total_length = int(self.length.sum())
+        method_counts = np.bincount(self.method, minlength=len(Method))
+        return {
+            'total_dimensions': n,
+            'valid_snakes': valid,
+            'invalid_snakes': n - valid,
+            'from_known': int(method_counts[Method.KNOWN]),
+            'from_search': int(method_counts[Method.SEARCH]),
+            'from_priming': int(method_counts[Method.PRIMING]),
+            'total_length': total_length,
+            'average_length': total_length / n if n else 0,
+            'total_time_seconds': float(self.time_s.sum()),
+            'total_time_hours': float(self.time_h.sum()),
+        }
 
 
 def export_analysis_data(
-    results: Dict[int, Dict],
+    results: Union[Dict[int, Dict], AnalysisTable],
     output_dir: str = "output/data",
     include_sequences: bool = True
 ) -> Dict[str, str]:
@@ -78,8 +321,9 @@ def export_analysis_data(
     
     Parameters
     ----------
-    results : Dict[int, Dict]
-        Analysis results dictionary mapping dimension to result data
+    results : Union[Dict[int, Dict], AnalysisTable]
+        Analysis results dictionary mapping dimension to result data, or
+        the same results as an ``AnalysisTable``
     output_dir : str, optional
         Output directory (default: "output/data")
     include_sequences : bool, optional
@@ -90,11 +334,16 @@ def export_analysis_data(
     Dict[str, str]
         Dictionary mapping format name to file path
     """
-    import os
     os.makedirs(output_dir, exist_ok=True)
     
     exported_files = {}
     
+    if isinstance(results, AnalysisTable):
+        table = results
+        results = table.to_dict()
+    else:
+        table = AnalysisTable.from_dict(results)
+    
     # Prepare comprehensive data
     comprehensive_data = {
         'metadata': {
@@ -131,8 +380,7 @@ def export_analysis_data(
     
     # Export JSON
     json_path = os.path.join(output_dir, 'analysis_results_comprehensive.json')
-    with open(json_path, 'w') as f:
-        json.dump(comprehensive_data, f, indent=2)
+    _write_json(comprehensive_data, json_path)
     exported_files['json'] = json_path
     
     # Export CSV summary
@@ -145,38 +393,14 @@ def export_analysis_data(
             'known_record', 'matches_known'
         ])
         
-        for dim in sorted(results.keys()):
-            result = results[dim]
-            writer.writerow([
-                dim,
-                result.get('length', 0),
-                result.get('is_valid', False),
-                result.get('method', 'unknown'),
-                result.get('fitness', 0),
-                result.get('computation_time_seconds', 0.0),
-                result.get('computation_time_hours', 0.0),
-                result.get('known_record', ''),
-                result.get('matches_known', False)
-            ])
+        writer.writerows(table.rows())
     exported_files['csv'] = csv_path
     
     # Export statistics summary
-    stats = {
-        'total_dimensions': len(results),
-        'valid_snakes': sum(1 for r in results.values() if r.get('is_valid', False)),
-        'invalid_snakes': sum(1 for r in results.values() if not r.get('is_valid', False)),
-        'from_known': sum(1 for r in results.values() if r.get('method') == 'known'),
-        'from_search': sum(1 for r in results.values() if r.get('method') == 'search'),
-        'from_priming': sum(1 for r in results.values() if r.get('method') == 'priming'),
-        'total_length': sum(r.get('length', 0) for r in results.values()),
-        'average_length': sum(r.get('length', 0) for r in results.values()) / len(results) if results else 0,
-        'total_time_seconds': sum(r.get('computation_time_seconds', 0.0) for r in results.values()),
-        'total_time_hours': sum(r.get('computation_time_hours', 0.0) for r in results.values()),
-    }
+    stats = table.statistics()
     
     stats_path = os.path.join(output_dir, 'statistics.json')
-    with open(stats_path, 'w') as f:
-        json.dump(stats, f, indent=2)
+    _write_json(stats, stats_path)
     exported_files['statistics'] = stats_path
     
     return exported_files
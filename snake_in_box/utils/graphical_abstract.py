@@ -1,5 +1,7 @@
 """Graphical abstract generator for 4x4 panel visualization."""
 
+import io
+from concurrent.futures import ProcessPoolExecutor
 from typing import List, Optional, Dict, Tuple
 import numpy as np
 try:
@@ -11,21 +13,29 @@ except ImportError:
 
 from ..core.snake_node import SnakeNode
 from ..core.transitions import transition_to_vertex
+from ._pool import spawn_context
 from .visualization_helpers import (
     get_color_scheme,
+    vertex_bit_matrix,
     pca_projection,
     pairwise_projection,
     force_directed_layout,
     hypercube_unfolding,
     apply_styling,
+    apply_styling_bulk,
 )
 
+# Let Agg split long snake paths into chunks while the panel is drawn
+_PANEL_RC_PARAMS = {'agg.path.chunksize': 10000}
+
 
 def generate_16d_panel(
     snake_nodes: Dict[int, SnakeNode],
     output_file: Optional[str] = None,
     figsize: Tuple[int, int] = (20, 20),
-    dpi: int = 300
+    dpi: int = 300,
+    max_workers: int = 1,
+    render_dpi: Optional[int] = None
 ) -> Optional[plt.Figure]:
     """Generate 4x4 panel graphical abstract for dimensions 1-16.
     
@@ -39,6 +49,15 @@ def generate_16d_panel(
         Figure size in inches (default: (20, 20))
     dpi : int, optional
         Resolution in dots per inch (default: 300)
+    max_workers : int, optional
+        Number of worker processes used to render the panels when
+        ``output_file`` is given (default: 1). Values above 1 render each
+        panel as a standalone tile in a separate process and composite
+        the tiles into the output image.
+    render_dpi : Optional[int], optional
+        Resolution at which a PNG ``output_file`` is rasterized
+        (default: None, rasterize at ``dpi``). When lower than ``dpi`` the
+        image is resampled to ``dpi`` with a Lanczos filter.
     
     Returns
     -------
@@ -48,35 +67,216 @@ def generate_16d_panel(
     if not HAS_MATPLOTLIB:
         raise ImportError("matplotlib required for graphical abstract")
     
+    draw_dpi = dpi
+    if output_file:
+        draw_dpi = _effective_render_dpi(output_file, dpi, render_dpi)
+    
+    if output_file and max_workers > 1:
+        _save_panel_parallel(snake_nodes, output_file, figsize, dpi,
+                             max_workers, draw_dpi)
+        return None
+    
     color_scheme = get_color_scheme()
-    fig, axes = plt.subplots(4, 4, figsize=figsize, dpi=dpi)
+    fig, axes = plt.subplots(4, 4, figsize=figsize, dpi=draw_dpi)
     axes = axes.flatten()
     
+    styled_axes = []
+    titles = []
     for dim in range(1, 17):
         ax = axes[dim - 1]
         
         if dim in snake_nodes:
             snake_node = snake_nodes[dim]
-            _plot_snake_in_panel(ax, snake_node, dim, color_scheme)
+            length = _plot_snake_in_panel(ax, snake_node, dim, color_scheme, style=False)
+            styled_axes.append(ax)
+            titles.append(f'Dimension {dim} (Length {length})')
         else:
-            # Empty panel with dimension label
-            ax.text(0.5, 0.5, f'Dim {dim}\nNo data', 
-                   ha='center', va='center', fontsize=12)
-            ax.set_xlim(0, 1)
-            ax.set_ylim(0, 1)
-            ax.axis('off')
+            _plot_empty_panel(ax, dim)
+    
+    # Style all snake panels together
+    apply_styling_bulk(styled_axes, titles, color_scheme)
     
     plt.tight_layout()
     
     if output_file:
-        plt.savefig(output_file, dpi=dpi, bbox_inches='tight')
-        plt.close()
+        with plt.rc_context(_PANEL_RC_PARAMS):
+            if draw_dpi < dpi:
+                from PIL import Image
+                
+                buffer = io.BytesIO()
+                plt.savefig(buffer, dpi=draw_dpi, format='png', bbox_inches='tight')
+                plt.close()
+                buffer.seek(0)
+                with Image.open(buffer) as image:
+                    _save_resampled(image, output_file, draw_dpi, dpi)
+            else:
+                plt.savefig(output_file, dpi=dpi, bbox_inches='tight')
+                plt.close()
         return None
     
     return fig
 
 
-def _plot_snake_in_panel(ax, snake_node: SnakeNode, dimension: int, color_scheme: Dict):
+def _effective_render_dpi(output_file: str, dpi: int, render_dpi: Optional[int]) -> int:
+    """Resolution to rasterize at before resampling to ``dpi``.
+    
+    Only PNG output is resampled; other formats are rendered at ``dpi``.
+    
+    Parameters
+    ----------
+    output_file : str
+        Output file path
+    dpi : int
+        Target resolution in dots per inch
+    render_dpi : Optional[int]
+        Requested rasterization resolution, or None
+    
+    Returns
+    -------
+    int
+        Resolution in dots per inch
+    """
+    if render_dpi is None or not output_file.lower().endswith('.png'):
+        return dpi
+    return min(render_dpi, dpi)
+
+
+def _save_resampled(image, output_file: str, render_dpi: int, dpi: int):
+    """Save a rasterized panel, resampling it from ``render_dpi`` to ``dpi``.
+    
+    Parameters
+    ----------
+    image : PIL.Image.Image
+        Rendered image
+    output_file : str
+        File to save the image
+    render_dpi : int
+        Resolution the image was rendered at
+    dpi : int
+        Target resolution in dots per inch
+    """
+    from PIL import Image
+    
+    if render_dpi != dpi:
+        scale = dpi / render_dpi
+        size = (round(image.width * scale), round(image.height * scale))
+        image = image.resize(size, Image.LANCZOS)
+    image.save(output_file, dpi=(dpi, dpi))
+
+
+def _save_panel_parallel(
+    snake_nodes: Dict[int, SnakeNode],
+    output_file: str,
+    figsize: Tuple[int, int],
+    dpi: int,
+    max_workers: int,
+    render_dpi: int
+):
+    """Render the 16 panels in worker processes and save the composite.
+    
+    Parameters
+    ----------
+    snake_nodes : Dict[int, SnakeNode]
+        Dictionary mapping dimension to snake node
+    output_file : str
+        File to save the composite image
+    figsize : Tuple[int, int]
+        Size of the full 4x4 figure in inches
+    dpi : int
+        Resolution in dots per inch
+    max_workers : int
+        Number of worker processes
+    render_dpi : int
+        Resolution the panels are rasterized at
+    """
+    from PIL import Image
+    
+    dims = list(range(1, 17))
+    panel_size = (figsize[0] / 4, figsize[1] / 4)
+    with ProcessPoolExecutor(max_workers=max_workers,
+                             mp_context=spawn_context()) as executor:
+        tiles = list(executor.map(
+            _render_panel_tile,
+            dims,
+            [snake_nodes.get(dim) for dim in dims],
+            [panel_size] * len(dims),
+            [render_dpi] * len(dims),
+        ))
+    
+    grid = np.vstack([np.hstack(tiles[row * 4:(row + 1) * 4]) for row in range(4)])
+    _save_resampled(Image.fromarray(grid, 'RGBA'), output_file, render_dpi, dpi)
+
+
+def _render_panel_tile(
+    dimension: int,
+    snake_node: Optional[SnakeNode],
+    panel_size: Tuple[float, float],
+    dpi: int
+) -> np.ndarray:
+    """Render a single panel into an RGBA pixel array.
+    
+    Uses a standalone Agg figure so it can run in a worker process
+    without touching pyplot state.
+    
+    Parameters
+    ----------
+    dimension : int
+        Dimension number
+    snake_node : Optional[SnakeNode]
+        Snake node to plot, or None for an empty panel
+    panel_size : Tuple[float, float]
+        Panel size in inches
+    dpi : int
+        Resolution in dots per inch
+    
+    Returns
+    -------
+    np.ndarray
+        RGBA pixel array of shape (height, width, 4)
+    """
+    from matplotlib import rc_context
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    
+    fig = Figure(figsize=panel_size, dpi=dpi)
+    canvas = FigureCanvasAgg(fig)
+    ax = fig.add_subplot(1, 1, 1)
+    
+    if snake_node is not None:
+        _plot_snake_in_panel(ax, snake_node, dimension, get_color_scheme())
+    else:
+        _plot_empty_panel(ax, dimension)
+    
+    fig.tight_layout()
+    with rc_context(_PANEL_RC_PARAMS):
+        canvas.draw()
+    return np.asarray(canvas.buffer_rgba()).copy()
+
+
+def _plot_empty_panel(ax, dimension: int):
+    """Draw a placeholder panel for a dimension without data.
+    
+    Parameters
+    ----------
+    ax : matplotlib.axes.Axes
+        Axes to draw in
+    dimension : int
+        Dimension number
+    """
+    ax.text(0.5, 0.5, f'Dim {dimension}\nNo data', 
+           ha='center', va='center', fontsize=12)
+    ax.set_xlim(0, 1)
+    ax.set_ylim(0, 1)
+    ax.axis('off')
+
+
+def _plot_snake_in_panel(
+    ax,
+    snake_node: SnakeNode,
+    dimension: int,
+    color_scheme: Dict,
+    style: bool = True
+) -> int:
     """Plot snake in a single panel.
     
     Parameters
@@ -89,25 +289,36 @@ def _plot_snake_in_panel(ax, snake_node: SnakeNode, dimension: int, color_scheme
         Dimension number
     color_scheme : Dict
         Color scheme dictionary
+    style : bool, optional
+        Apply title, grid and background styling (default: True); the
+        caller styles the panel when False
+    
+    Returns
+    -------
+    int
+        Snake length
     """
     vertices = transition_to_vertex(snake_node.transition_sequence, dimension)
     length = len(vertices) - 1
+    bits = vertex_bit_matrix(vertices, dimension)
+    snake_color = color_scheme['snake_color']
+    snake_marker = color_scheme['snake_marker']
     
     if dimension == 1:
-        x = [(v >> 0) & 1 for v in vertices]
-        y = list(range(len(vertices)))
-        ax.plot(x, y, color=color_scheme['snake_color'],
-                marker=color_scheme['snake_marker'],
-                linewidth=1.5, markersize=4)
+        x = bits[:, 0]
+        y = np.arange(len(vertices))
+        ax.plot(x, y, color=snake_color,
+                marker=snake_marker,
+                linewidth=1.5, markersize=4, rasterized=True)
         ax.set_xlim(-0.1, 1.1)
         ax.set_xticks([0, 1])
         
     elif dimension == 2:
-        x = [(v >> 0) & 1 for v in vertices]
-        y = [(v >> 1) & 1 for v in vertices]
-        ax.plot(x, y, color=color_scheme['snake_color'],
-                marker=color_scheme['snake_marker'],
-                linewidth=1.5, markersize=4)
+        x = bits[:, 0]
+        y = bits[:, 1]
+        ax.plot(x, y, color=snake_color,
+                marker=snake_marker,
+                linewidth=1.5, markersize=4, rasterized=True)
         ax.set_xlim(-0.1, 1.1)
         ax.set_ylim(-0.1, 1.1)
         ax.set_xticks([0, 1])
@@ -116,13 +327,14 @@ def _plot_snake_in_panel(ax, snake_node: SnakeNode, dimension: int, color_scheme
         
     elif dimension == 3:
         # 3D projection to 2D
-        x = [(v >> 0) & 1 for v in vertices]
-        y = [(v >> 1) & 1 for v in vertices]
-        z = [(v >> 2) & 1 for v in vertices]
+        x = bits[:, 0]
+        y = bits[:, 1]
+        z = bits[:, 2]
         # Simple 2D projection: x-y with z as color/size
-        ax.scatter(x, y, c=z, cmap='viridis', s=30, alpha=0.7)
-        ax.plot(x, y, color=color_scheme['snake_color'],
-                linewidth=1.5, alpha=0.5)
+        ax.scatter(x, y, c=z, cmap='viridis', s=30, alpha=0.7,
+                   rasterized=True)
+        ax.plot(x, y, color=snake_color,
+                linewidth=1.5, alpha=0.5, rasterized=True)
         ax.set_xlim(-0.1, 1.1)
         ax.set_ylim(-0.1, 1.1)
         ax.set_xticks([0, 1])
@@ -132,29 +344,35 @@ def _plot_snake_in_panel(ax, snake_node: SnakeNode, dimension: int, color_scheme
     else:
         # High dimension: use PCA projection
         try:
-            coords = pca_projection(vertices, dimension, n_components=2)
+            coords = pca_projection(vertices, dimension, n_components=2,
+                                    bit_matrix=bits)
             ax.plot(coords[:, 0], coords[:, 1],
-                   color=color_scheme['snake_color'],
-                   marker=color_scheme['snake_marker'],
-                   linewidth=1.5, markersize=3, alpha=0.8)
-        except:
+                   color=snake_color,
+                   marker=snake_marker,
+                   linewidth=1.5, markersize=3, alpha=0.8,
+                   rasterized=True)
+        except (ValueError, np.linalg.LinAlgError):
             # Fallback: use first two dimensions
-            x = [(v >> 0) & 1 for v in vertices]
-            y = [(v >> 1) & 1 for v in vertices]
-            ax.plot(x, y, color=color_scheme['snake_color'],
-                   marker=color_scheme['snake_marker'],
-                   linewidth=1.5, markersize=3)
+            x = bits[:, 0]
+            y = bits[:, 1]
+            ax.plot(x, y, color=snake_color,
+                   marker=snake_marker,
+                   linewidth=1.5, markersize=3, rasterized=True)
     
     # Apply styling
-    apply_styling(ax, dimension, length, color_scheme)
+    if style:
+        apply_styling(ax, dimension, length, color_scheme)
     ax.tick_params(labelsize=8)
+    return length
 
 
 def generate_panel_from_sequences(
     sequences: Dict[int, List[int]],
     output_file: Optional[str] = None,
     figsize: Tuple[int, int] = (20, 20),
-    dpi: int = 300
+    dpi: int = 300,
+    max_workers: int = 1,
+    render_dpi: Optional[int] = None
 ) -> Optional[plt.Figure]:
     """Generate panel from transition sequences.
     
@@ -168,6 +386,10 @@ def generate_panel_from_sequences(
         Figure size
     dpi : int, optional
         Resolution
+    max_workers : int, optional
+        Number of worker processes used to render the panels
+    render_dpi : Optional[int], optional
+        Resolution at which a PNG output file is rasterized
     
     Returns
     -------
@@ -178,17 +400,20 @@ def generate_panel_from_sequences(
     for dim, seq in sequences.items():
         try:
             snake_nodes[dim] = SnakeNode(seq, dim)
-        except:
+        except (ValueError, TypeError):
             pass  # Skip invalid sequences
     
-    return generate_16d_panel(snake_nodes, output_file, figsize, dpi)
+    return generate_16d_panel(snake_nodes, output_file, figsize, dpi, max_workers,
+                              render_dpi)
 
 
 def generate_panel_from_analysis_results(
     analysis_results: Dict[int, Dict],
     output_file: Optional[str] = None,
     figsize: Tuple[int, int] = (20, 20),
-    dpi: int = 300
+    dpi: int = 300,
+    max_workers: int = 1,
+    render_dpi: Optional[int] = None
 ) -> Optional[plt.Figure]:
     """Generate panel from analysis results.
     
@@ -203,6 +428,10 @@ def generate_panel_from_analysis_results(
         Figure size
     dpi : int, optional
         Resolution
+    max_workers : int, optional
+        Number of worker processes used to render the panels
+    render_dpi : Optional[int], optional
+        Resolution at which a PNG output file is rasterized
     
     Returns
     -------
@@ -216,8 +445,9 @@ def generate_panel_from_analysis_results(
         elif 'transition_sequence' in result:
             try:
                 snake_nodes[dim] = SnakeNode(result['transition_sequence'], dim)
-            except:
+            except (ValueError, TypeError):
                 pass
     
-    return generate_16d_panel(snake_nodes, output_file, figsize, dpi)
+    return generate_16d_panel(snake_nodes, output_file, figsize, dpi, max_workers,
+                              render_dpi)
 
@@ -1,12 +1,150 @@
 """Performance plotting functions for computation time analysis."""
 
+import hashlib
+import os
+from importlib.util import find_spec
+from io import BytesIO
 from typing import Dict, List, Optional
 import numpy as np
-try:
-    import matplotlib.pyplot as plt
-    HAS_MATPLOTLIB = True
-except ImportError:
-    HAS_MATPLOTLIB = False
+from ._analysis_memo import (
+    _times_key,
+    fit_exponential_model_cached,
+    analyze_computation_complexity_cached,
+    identify_slowdown_points_cached,
+)
+
+# matplotlib is imported inside the plot functions, so importing this
+# module (e.g. for the analysis memo) does not load it
+HAS_MATPLOTLIB = find_spec('matplotlib') is not None
+
+# Output resolution for saved plots. Figures are laid out with
+# tight_layout(), so saving needs a single render pass.
+_DEFAULT_DPI = 150
+
+
+def _ensure_dir(path: str) -> None:
+    """Create the parent directory of ``path`` if it is missing."""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+
+def _new_figure(figsize) -> "matplotlib.figure.Figure":
+    """Create a figure outside pyplot's figure manager.
+    
+    The plot_* functions only save to file, so a bare ``Figure`` skips
+    creating a backend window manager and needs no ``plt.close``. It is
+    attached to an Agg canvas directly, so rendering never goes through
+    the configured (possibly interactive) backend and the global backend
+    selection is left alone.
+    """
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+    fig = Figure(figsize=figsize)
+    FigureCanvasAgg(fig)
+    return fig
+
+
+def _save_fig(fig, path: str, dpi: int = _DEFAULT_DPI) -> bool:
+    """Render a figure once and write it if the bytes changed.
+    
+    Parameters
+    ----------
+    fig : matplotlib.figure.Figure
+        Figure to render
+    path : str
+        Output path; the format follows its extension (default PNG)
+    dpi : int, optional
+        Output resolution (default: 150)
+    
+    Returns
+    -------
+    bool
+        True if the file was written, False if it was already up to date
+    """
+    fmt = os.path.splitext(path)[1][1:].lower() or 'png'
+    buf = BytesIO()
+    fig.savefig(buf, format=fmt, dpi=dpi)
+    data = buf.getvalue()
+    try:
+        with open(path, 'rb') as f:
+            if f.read() == data:
+                return False
+    except OSError:
+        pass
+    with open(path, 'wb') as f:
+        f.write(data)
+    return True
+
+
+def _inputs_digest(key) -> str:
+    """Hex digest identifying a plot's inputs."""
+    return hashlib.blake2b(repr(key).encode(), digest_size=16).hexdigest()
+
+
+def _inputs_unchanged(path: str, key) -> bool:
+    """Check whether ``path`` was already rendered from the same inputs.
+    
+    The digest of the inputs is kept in a ``<path>.hash`` sidecar written by
+    :func:`_write_hash`; a missing output or sidecar counts as changed.
+    """
+    sidecar = path + '.hash'
+    if not (os.path.exists(path) and os.path.exists(sidecar)):
+        return False
+    with open(sidecar) as f:
+        return f.read() == _inputs_digest(key)
+
+
+def _write_hash(path: str, key) -> None:
+    """Record the digest of the inputs ``path`` was rendered from."""
+    with open(path + '.hash', 'w') as f:
+        f.write(_inputs_digest(key))
+
+
+def build_analysis_bundle(
+    times: Dict[int, float],
+    memory_dimensions: Optional[List[int]] = None
+) -> Dict:
+    """Run the analyses behind the performance plots once.
+    
+    Pass the result as ``bundle`` to the plot functions so a driver that
+    produces the whole suite fits and analyses ``times`` a single time.
+    
+    Parameters
+    ----------
+    times : Dict[int, float]
+        Dictionary mapping dimension to computation time in seconds
+    memory_dimensions : Optional[List[int]], optional
+        Dimensions for the memory analysis (default: None, the keys of
+        ``times``)
+    
+    Returns
+    -------
+    Dict
+        Bundle with keys:
+        - times: Tuple - sorted items of the ``times`` it was built from
+        - model: Dict - fit_exponential_model() result
+        - complexity: Dict - analyze_computation_complexity() result
+        - slowdown_points: List[int] - identify_slowdown_points() result
+        - memory: Dict[int, Dict] - analyze_memory_complexity() result
+    """
+    # Lazy import to avoid circular dependency
+    from ..analysis.exponential_analysis import analyze_memory_complexity
+    
+    if memory_dimensions is None:
+        memory_dimensions = sorted(times)
+    return {
+        'times': _times_key(times),
+        'model': fit_exponential_model_cached(times),
+        'complexity': analyze_computation_complexity_cached(times),
+        'slowdown_points': identify_slowdown_points_cached(times),
+        'memory': analyze_memory_complexity(list(memory_dimensions)),
+    }
+
+
+def _bundle_matches(bundle: Optional[Dict], times: Dict[int, float]) -> bool:
+    """Check that a bundle was built from these ``times``."""
+    return bundle is not None and bundle.get('times') == _times_key(times)
 
 
 def plot_computation_time_vs_dimension(
@@ -28,6 +166,10 @@ def plot_computation_time_vs_dimension(
     if not HAS_MATPLOTLIB:
         return
     
+    inputs_key = ('computation_time', sorted(times.items()), log_scale, _DEFAULT_DPI)
+    if _inputs_unchanged(output_file, inputs_key):
+        return
+    
     dimensions = sorted(times.keys())
     time_values = [times[d] for d in dimensions]
     
@@ -38,16 +180,20 @@ def plot_computation_time_vs_dimension(
     
     valid_dims, valid_times = zip(*valid_data)
     
-    fig, ax = plt.subplots(figsize=(12, 6))
+    from matplotlib.transforms import offset_copy
+    
+    fig = _new_figure((12, 6))
+    ax = fig.subplots()
     
-    ax.scatter(valid_dims, valid_times, s=100, alpha=0.7, c=valid_dims, 
-               cmap='viridis', edgecolors='black', linewidths=1.5)
+    points = ax.scatter(valid_dims, valid_times, s=100, alpha=0.7, c=valid_dims,
+                        cmap='viridis', edgecolors='black', linewidths=1.5)
     ax.plot(valid_dims, valid_times, '--', alpha=0.5, linewidth=1)
     
-    # Add dimension labels
-    for d, t in valid_data:
-        ax.annotate(f'D{d}', (d, t), xytext=(5, 5), textcoords='offset points', 
-                   fontsize=9, fontweight='bold')
+    # Add dimension labels, offset 5 points up and right of each marker
+    labels = [f'D{d}' for d in valid_dims]
+    label_transform = offset_copy(ax.transData, fig=fig, x=5, y=5, units='points')
+    for d, t, label in zip(valid_dims, valid_times, labels):
+        ax.text(d, t, label, transform=label_transform, fontsize=9, fontweight='bold')
     
     ax.set_xlabel('Dimension N', fontsize=12, fontweight='bold')
     ax.set_ylabel('Computation Time (seconds)', fontsize=12, fontweight='bold')
@@ -58,18 +204,18 @@ def plot_computation_time_vs_dimension(
         ax.set_yscale('log')
         ax.set_ylabel('Computation Time (seconds, log scale)', fontsize=12, fontweight='bold')
     
-    plt.colorbar(plt.cm.ScalarMappable(cmap='viridis'), ax=ax, label='Dimension')
-    plt.tight_layout()
+    fig.colorbar(points, ax=ax, label='Dimension')
+    fig.tight_layout()
     
-    import os
-    os.makedirs(os.path.dirname(output_file), exist_ok=True)
-    plt.savefig(output_file, dpi=300, bbox_inches='tight')
-    plt.close()
+    _ensure_dir(output_file)
+    _save_fig(fig, output_file)
+    _write_hash(output_file, inputs_key)
 
 
 def plot_exponential_fit(
     times: Dict[int, float],
-    output_file: str = "output/visualizations/exponential_fit.png"
+    output_file: str = "output/visualizations/exponential_fit.png",
+    bundle: Optional[Dict] = None
 ) -> None:
     """Plot computation time with fitted exponential curve.
     
@@ -79,10 +225,18 @@ def plot_exponential_fit(
         Dictionary mapping dimension to computation time
     output_file : str, optional
         Output file path
+    bundle : Optional[Dict], optional
+        Precomputed build_analysis_bundle() result; ignored unless it
+        was built from the same inputs
+        (default: None, analyse here)
     """
     if not HAS_MATPLOTLIB:
         return
     
+    inputs_key = ('exponential_fit', sorted(times.items()), _DEFAULT_DPI)
+    if _inputs_unchanged(output_file, inputs_key):
+        return
+    
     dimensions = sorted(times.keys())
     time_values = [times[d] for d in dimensions]
     
@@ -96,10 +250,14 @@ def plot_exponential_fit(
     valid_times = np.array(valid_times)
     
     # Fit exponential model (lazy import to avoid circular dependency)
-    from ..analysis.exponential_analysis import fit_exponential_model, estimate_time_for_dimension
-    model = fit_exponential_model(times)
+    from ..analysis.exponential_analysis import estimate_time_for_dimensions
+    if _bundle_matches(bundle, times):
+        model = bundle['model']
+    else:
+        model = fit_exponential_model_cached(times)
     
-    fig, ax = plt.subplots(figsize=(12, 6))
+    fig = _new_figure((12, 6))
+    ax = fig.subplots()
     
     # Plot actual data
     ax.scatter(valid_dims, valid_times, s=150, alpha=0.7, color='steelblue',
@@ -108,7 +266,7 @@ def plot_exponential_fit(
     # Plot fitted curve
     if model['r_squared'] > 0.1:
         dim_range = np.arange(min(valid_dims), max(valid_dims) + 1, 0.1)
-        fitted_times = [estimate_time_for_dimension(int(d), model) for d in dim_range]
+        fitted_times = estimate_time_for_dimensions(dim_range, model)
         ax.plot(dim_range, fitted_times, 'r-', linewidth=2, alpha=0.7,
                label=f"Exponential Fit (R²={model['r_squared']:.3f})", zorder=2)
     
@@ -119,17 +277,17 @@ def plot_exponential_fit(
     ax.grid(alpha=0.3)
     ax.legend()
     
-    plt.tight_layout()
+    fig.tight_layout()
     
-    import os
-    os.makedirs(os.path.dirname(output_file), exist_ok=True)
-    plt.savefig(output_file, dpi=300, bbox_inches='tight')
-    plt.close()
+    _ensure_dir(output_file)
+    _save_fig(fig, output_file)
+    _write_hash(output_file, inputs_key)
 
 
 def plot_slowdown_analysis(
     times: Dict[int, float],
-    output_file: str = "output/visualizations/slowdown_analysis.png"
+    output_file: str = "output/visualizations/slowdown_analysis.png",
+    bundle: Optional[Dict] = None
 ) -> None:
     """Plot slowdown analysis highlighting exponential growth regions.
     
@@ -139,12 +297,17 @@ def plot_slowdown_analysis(
         Dictionary mapping dimension to computation time
     output_file : str, optional
         Output file path
+    bundle : Optional[Dict], optional
+        Precomputed build_analysis_bundle() result; ignored unless it
+        was built from the same inputs
+        (default: None, analyse here)
     """
     if not HAS_MATPLOTLIB:
         return
     
-    # Lazy import to avoid circular dependency
-    from ..analysis.exponential_analysis import analyze_computation_complexity, identify_slowdown_points
+    inputs_key = ('slowdown_analysis', sorted(times.items()), _DEFAULT_DPI)
+    if _inputs_unchanged(output_file, inputs_key):
+        return
     
     dimensions = sorted(times.keys())
     time_values = [times[d] for d in dimensions]
@@ -155,16 +318,31 @@ def plot_slowdown_analysis(
     
     valid_dims, valid_times = zip(*valid_data)
     
-    complexity = analyze_computation_complexity(times)
-    slowdown_points = identify_slowdown_points(times)
-    
-    fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(12, 10))
-    
-    # Top plot: Time vs dimension with slowdown points highlighted
-    colors = ['green' if d not in slowdown_points else 'red' for d in valid_dims]
-    ax1.scatter(valid_dims, valid_times, s=150, c=colors, alpha=0.7,
-               edgecolors='black', linewidths=1.5)
-    ax1.plot(valid_dims, valid_times, '--', alpha=0.3, linewidth=1)
+    if _bundle_matches(bundle, times):
+        complexity = bundle['complexity']
+        slowdown_points = bundle['slowdown_points']
+    else:
+        complexity = analyze_computation_complexity_cached(times)
+        slowdown_points = identify_slowdown_points_cached(times)
+    
+    from matplotlib.colors import to_rgba
+    
+    fig = _new_figure((12, 10))
+    ax1, ax2 = fig.subplots(2, 1)
+    
+    # Top plot: Time vs dimension with slowdown points highlighted.
+    # The dashed line carries the regular markers; only slowdown points
+    # need a second artist.
+    slowdown_set = set(slowdown_points)
+    normal_idx = [i for i, d in enumerate(valid_dims) if d not in slowdown_set]
+    slow_idx = [i for i, d in enumerate(valid_dims) if d in slowdown_set]
+    ax1.plot(valid_dims, valid_times, linestyle='--', linewidth=1,
+             color=to_rgba('C0', 0.3), marker='o', markevery=normal_idx,
+             markersize=np.sqrt(150), markerfacecolor=to_rgba('green', 0.7),
+             markeredgecolor=to_rgba('black', 0.7), markeredgewidth=1.5)
+    if slow_idx:
+        ax1.scatter([valid_dims[i] for i in slow_idx], [valid_times[i] for i in slow_idx],
+                   s=150, c='red', alpha=0.7, edgecolors='black', linewidths=1.5)
     
     # Highlight exponential regions
     for start, end in complexity['exponential_regions']:
@@ -191,17 +369,17 @@ def plot_slowdown_analysis(
         ax2.grid(axis='y', alpha=0.3)
         ax2.legend()
     
-    plt.tight_layout()
+    fig.tight_layout()
     
-    import os
-    os.makedirs(os.path.dirname(output_file), exist_ok=True)
-    plt.savefig(output_file, dpi=300, bbox_inches='tight')
-    plt.close()
+    _ensure_dir(output_file)
+    _save_fig(fig, output_file)
+    _write_hash(output_file, inputs_key)
 
 
 def plot_memory_vs_dimension(
     dimensions: List[int],
-    output_file: str = "output/visualizations/memory_vs_dimension.png"
+    output_file: str = "output/visualizations/memory_vs_dimension.png",
+    bundle: Optional[Dict] = None
 ) -> None:
     """Plot memory requirements vs dimension.
     
@@ -211,20 +389,31 @@ def plot_memory_vs_dimension(
         List of dimensions to analyze
     output_file : str, optional
         Output file path
+    bundle : Optional[Dict], optional
+        Precomputed build_analysis_bundle() result; ignored unless it
+        was built from the same inputs
+        (default: None, analyse here)
     """
     if not HAS_MATPLOTLIB:
         return
     
-    # Lazy import to avoid circular dependency
-    from ..analysis.exponential_analysis import analyze_memory_complexity
+    inputs_key = ('memory', sorted(dimensions), _DEFAULT_DPI)
+    if _inputs_unchanged(output_file, inputs_key):
+        return
     
-    memory_analysis = analyze_memory_complexity(dimensions)
+    if bundle is not None and sorted(bundle['memory']) == sorted(dimensions):
+        memory_analysis = bundle['memory']
+    else:
+        # Lazy import to avoid circular dependency
+        from ..analysis.exponential_analysis import analyze_memory_complexity
+        memory_analysis = analyze_memory_complexity(dimensions)
     
     dims = sorted(memory_analysis.keys())
     bitmap_mem = [memory_analysis[d]['bitmap_memory_gb'] for d in dims]
     est_mem = [memory_analysis[d]['estimated_memory_gb'] for d in dims]
     
-    fig, ax = plt.subplots(figsize=(12, 6))
+    fig = _new_figure((12, 6))
+    ax = fig.subplots()
     
     ax.plot(dims, bitmap_mem, 'o-', label='Bitmap Memory', linewidth=2, markersize=8)
     ax.plot(dims, est_mem, 's-', label='Estimated Total Memory', linewidth=2, markersize=8)
@@ -236,10 +425,9 @@ def plot_memory_vs_dimension(
     ax.grid(alpha=0.3)
     ax.legend()
     
-    plt.tight_layout()
+    fig.tight_layout()
     
-    import os
-    os.makedirs(os.path.dirname(output_file), exist_ok=True)
-    plt.savefig(output_file, dpi=300, bbox_inches='tight')
-    plt.close()
+    _ensure_dir(output_file)
+    _save_fig(fig, output_file)
+    _write_hash(output_file, inputs_key)
 
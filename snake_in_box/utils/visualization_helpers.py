@@ -1,16 +1,126 @@
 """Visualization helper functions."""
 
-from typing import List, Tuple, Dict, Optional
+import hashlib
+from collections import OrderedDict
+from importlib.util import find_spec
+from types import MappingProxyType
+from typing import Any, List, Mapping, Tuple, Dict, Optional
 import numpy as np
-try:
-    import matplotlib.pyplot as plt
-    from matplotlib.colors import LinearSegmentedColormap
-    HAS_MATPLOTLIB = True
-except ImportError:
-    HAS_MATPLOTLIB = False
+from ._jit import njit, NUMBA_AVAILABLE
+
+# matplotlib is imported inside the plotting helpers, so the projection
+# helpers load without it
+HAS_MATPLOTLIB = find_spec('matplotlib') is not None
+
+# Most recently used PCA projections, keyed by (vertex digest, dimension,
+# n_components), so regenerating the same figures skips the decomposition
+_PCA_CACHE_SIZE = 256
+_pca_cache: "OrderedDict[Tuple[bytes, int, int], np.ndarray]" = OrderedDict()
+
+# Rows of the pairwise displacement tensor processed at once in
+# force_directed_layout; bounds peak memory to about 16 * rows * n bytes
+_LAYOUT_BLOCK_ROWS = 256
+
+# Vertex count from which vertex_bit_matrix uses the Numba kernel; below
+# it the NumPy broadcast is already well under a millisecond
+_NUMBA_BITS_MIN_VERTICES = 4096
+
+# Color schemes built once and shared read-only by get_color_scheme()
+_COLOR_SCHEMES: Mapping[str, Mapping[str, Any]] = MappingProxyType({
+    'default': MappingProxyType({
+        'snake_color': 'red',
+        'snake_marker': 'o',
+        'snake_linewidth': 2,
+        'snake_markersize': 8,
+        'background_color': 'white',
+        'grid_color': 'gray',
+        'grid_alpha': 0.3,
+    }),
+    'blue': MappingProxyType({
+        'snake_color': 'blue',
+        'snake_marker': 's',
+        'snake_linewidth': 2,
+        'snake_markersize': 6,
+        'background_color': 'white',
+        'grid_color': 'lightblue',
+        'grid_alpha': 0.2,
+    }),
+    'green': MappingProxyType({
+        'snake_color': 'green',
+        'snake_marker': '^',
+        'snake_linewidth': 2,
+        'snake_markersize': 6,
+        'background_color': 'white',
+        'grid_color': 'lightgreen',
+        'grid_alpha': 0.2,
+    }),
+})
+
+
+@njit(cache=True, fastmath=True)
+def _force_directed_kernel(pos, k, dt, iterations):
+    """Run force-directed iterations in place with scalar loops.
+    
+    Compiled by Numba when installed; chain adjacency is implicit.
+    """
+    n = pos.shape[0]
+    k2 = k * k
+    forces = np.empty_like(pos)
+    
+    for _ in range(iterations):
+        for i in range(n):
+            xi = pos[i, 0]
+            yi = pos[i, 1]
+            fx = 0.0
+            fy = 0.0
+            for j in range(n):
+                dx = xi - pos[j, 0]
+                dy = yi - pos[j, 1]
+                d2 = dx * dx + dy * dy
+                if d2 > 0.0:
+                    fx += k2 * dx / d2
+                    fy += k2 * dy / d2
+            forces[i, 0] = fx
+            forces[i, 1] = fy
+        
+        for i in range(n - 1):
+            px = (pos[i + 1, 0] - pos[i, 0]) / k
+            py = (pos[i + 1, 1] - pos[i, 1]) / k
+            forces[i, 0] += px
+            forces[i, 1] += py
+            forces[i + 1, 0] -= px
+            forces[i + 1, 1] -= py
+        
+        mean_x = 0.0
+        mean_y = 0.0
+        for i in range(n):
+            pos[i, 0] += dt * forces[i, 0]
+            pos[i, 1] += dt * forces[i, 1]
+            mean_x += pos[i, 0]
+            mean_y += pos[i, 1]
+        mean_x /= n
+        mean_y /= n
+        for i in range(n):
+            pos[i, 0] -= mean_x
+            pos[i, 1] -= mean_y
+    
+    return pos
 
 
-def get_color_scheme(scheme: str = 'default') -> Dict[str, any]:
+@njit(cache=True, fastmath=True)
+def _unpack_bits_kernel(v, dimension, out):
+    """Write bit ``j`` of ``v[i]`` to ``out[i, j]`` without temporaries.
+    
+    Serial: the loop is memory-bound, so threads would not speed it up.
+    """
+    for i in range(v.shape[0]):
+        vi = v[i]
+        for j in range(dimension):
+            out[i, j] = (vi >> j) & 1
+    return out
+
+
+def get_color_scheme(scheme: str = 'default') -> Mapping[str, Any]:
     """Get color scheme for visualization.
     
     Parameters
@@ -20,42 +130,49 @@ def get_color_scheme(scheme: str = 'default') -> Dict[str, any]:
     
     Returns
     -------
-    Dict[str, any]
-        Color scheme dictionary
+    Mapping[str, Any]
+        Read-only color scheme mapping; copy with ``dict()`` to customize
     """
-    schemes = {
-        'default': {
-            'snake_color': 'red',
-            'snake_marker': 'o',
-            'snake_linewidth': 2,
-            'snake_markersize': 8,
-            'background_color': 'white',
-            'grid_color': 'gray',
-            'grid_alpha': 0.3,
-        },
-        'blue': {
-            'snake_color': 'blue',
-            'snake_marker': 's',
-            'snake_linewidth': 2,
-            'snake_markersize': 6,
-            'background_color': 'white',
-            'grid_color': 'lightblue',
-            'grid_alpha': 0.2,
-        },
-        'green': {
-            'snake_color': 'green',
-            'snake_marker': '^',
-            'snake_linewidth': 2,
-            'snake_markersize': 6,
-            'background_color': 'white',
-            'grid_color': 'lightgreen',
-            'grid_alpha': 0.2,
-        },
-    }
-    return schemes.get(scheme, schemes['default'])
+    return _COLOR_SCHEMES.get(scheme, _COLOR_SCHEMES['default'])
 
 
-def pca_projection(vertices: List[int], dimension: int, n_components: int = 2) -> np.ndarray:
+def vertex_bit_matrix(vertices: List[int], dimension: int) -> np.ndarray:
+    """Unpack vertices into their binary coordinates.
+    
+    Parameters
+    ----------
+    vertices : List[int]
+        Vertex sequence
+    dimension : int
+        Hypercube dimension
+    
+    Returns
+    -------
+    np.ndarray
+        Array of shape (n_vertices, dimension) where column ``j`` holds
+        bit ``j`` of each vertex
+    """
+    v = np.asarray(vertices, dtype=np.int64)
+    if NUMBA_AVAILABLE and len(v) >= _NUMBA_BITS_MIN_VERTICES:
+        out = np.empty((len(v), dimension), dtype=np.uint8)
+        return _unpack_bits_kernel(v, dimension, out)
+    
+    # Vertices of at most 8 dimensions fit in one byte
+    if dimension <= 8:
+        return np.unpackbits(
+            v.astype(np.uint8).reshape(-1, 1), axis=1, bitorder='little'
+        )[:, :dimension]
+    
+    v = v.reshape(-1, 1)
+    return ((v >> np.arange(dimension, dtype=np.int64)) & 1).astype(np.uint8)
+
+
+def pca_projection(
+    vertices: List[int],
+    dimension: int,
+    n_components: int = 2,
+    bit_matrix: Optional[np.ndarray] = None
+) -> np.ndarray:
     """Project vertices to lower dimension using PCA.
     
     Parameters
@@ -66,44 +183,56 @@ def pca_projection(vertices: List[int], dimension: int, n_components: int = 2) -
         Original dimension
     n_components : int, optional
         Number of components (default: 2)
+    bit_matrix : Optional[np.ndarray], optional
+        Precomputed output of ``vertex_bit_matrix(vertices, dimension)``;
+        used instead of rebuilding the binary matrix (default: None)
     
     Returns
     -------
     np.ndarray
         Projected coordinates (n_vertices, n_components)
+    
+    Notes
+    -----
+    Results are memoized on a digest of the vertex sequence, so repeated
+    projections of the same snake return a copy of the cached array.
     """
     if not HAS_MATPLOTLIB:
         raise ImportError("matplotlib required for PCA projection")
     
-    # Convert vertices to binary matrix
-    n_vertices = len(vertices)
-    binary_matrix = np.zeros((n_vertices, dimension))
+    digest = hashlib.blake2b(
+        np.asarray(vertices, dtype=np.int64).tobytes(), digest_size=16
+    ).digest()
+    key = (digest, dimension, n_components)
+    cached = _pca_cache.get(key)
+    if cached is not None:
+        _pca_cache.move_to_end(key)
+        return cached.copy()
     
-    for i, vertex in enumerate(vertices):
-        for j in range(dimension):
-            binary_matrix[i, j] = (vertex >> j) & 1
+    if bit_matrix is None:
+        bit_matrix = vertex_bit_matrix(vertices, dimension)
+    binary_matrix = np.asarray(bit_matrix, dtype=np.float64)
     
     # Center the data
     mean = np.mean(binary_matrix, axis=0)
     centered = binary_matrix - mean
     
-    # Compute covariance matrix
-    cov = np.cov(centered.T)
-    
-    # Eigenvalue decomposition
-    eigenvalues, eigenvectors = np.linalg.eigh(cov)
+    # Principal axes from the d x d scatter matrix; it has the covariance
+    # eigenvectors without np.cov's copy and normalization, and eigh
+    # returns them in ascending eigenvalue order
+    eigenvalues, eigenvectors = np.linalg.eigh(centered.T @ centered)
     
-    # Sort by eigenvalue (descending)
-    idx = eigenvalues.argsort()[::-1]
-    eigenvectors = eigenvectors[:, idx]
+    # Project to the n_components largest
+    projection = centered @ eigenvectors[:, ::-1][:, :n_components]
     
-    # Project to n_components
-    projection = centered @ eigenvectors[:, :n_components]
+    _pca_cache[key] = projection
+    if len(_pca_cache) > _PCA_CACHE_SIZE:
+        _pca_cache.popitem(last=False)
     
-    return projection
+    return projection.copy()
 
 
-def pairwise_projection(vertices: List[int], dimension: int, dim1: int, dim2: int) -> Tuple[List[float], List[float]]:
+def pairwise_projection(vertices: List[int], dimension: int, dim1: int, dim2: int) -> Tuple[np.ndarray, np.ndarray]:
     """Project vertices to 2D using two specific dimensions.
     
     Parameters
@@ -119,11 +248,12 @@ def pairwise_projection(vertices: List[int], dimension: int, dim1: int, dim2: in
     
     Returns
     -------
-    Tuple[List[float], List[float]]
-        (x_coordinates, y_coordinates)
+    Tuple[np.ndarray, np.ndarray]
+        (x_coordinates, y_coordinates) as float arrays of 0.0/1.0
     """
-    x = [(v >> dim1) & 1 for v in vertices]
-    y = [(v >> dim2) & 1 for v in vertices]
+    v = np.asarray(vertices, dtype=np.int64)
+    x = ((v >> dim1) & 1).astype(np.float64)
+    y = ((v >> dim2) & 1).astype(np.float64)
     return x, y
 
 
@@ -143,41 +273,41 @@ def force_directed_layout(vertices: List[int], dimension: int, iterations: int =
     -------
     np.ndarray
         Coordinates (n_vertices, 2)
+    
+    Notes
+    -----
+    Uses a serial Numba kernel when Numba is installed, otherwise
+    vectorized NumPy.
     """
     n_vertices = len(vertices)
     
     # Initialize positions randomly
     pos = np.random.rand(n_vertices, 2) * 10
     
-    # Compute adjacency (consecutive vertices are adjacent)
-    adj = np.zeros((n_vertices, n_vertices), dtype=bool)
-    for i in range(n_vertices - 1):
-        adj[i, i + 1] = True
-        adj[i + 1, i] = True
-    
     # Force-directed algorithm
     k = np.sqrt(100.0 / n_vertices)  # Optimal distance
     dt = 0.1  # Time step
     
+    if NUMBA_AVAILABLE:
+        return _force_directed_kernel(pos, k, dt, iterations)
+    
     for _ in range(iterations):
-        # Repulsive forces
+        # Repulsive forces: k^2 * diff / dist^2 summed over all other
+        # vertices, in row blocks to bound the (rows, n, 2) temporaries
         forces = np.zeros((n_vertices, 2))
-        for i in range(n_vertices):
-            for j in range(n_vertices):
-                if i != j:
-                    diff = pos[i] - pos[j]
-                    dist = np.linalg.norm(diff)
-                    if dist > 0:
-                        forces[i] += k * k / dist * diff / dist
+        for start in range(0, n_vertices, _LAYOUT_BLOCK_ROWS):
+            stop = min(start + _LAYOUT_BLOCK_ROWS, n_vertices)
+            diff = pos[start:stop, None, :] - pos[None, :, :]
+            dist2 = np.einsum('ijk,ijk->ij', diff, diff)
+            # Self pairs and coincident vertices exert no force
+            dist2[dist2 == 0] = np.inf
+            forces[start:stop] = k * k * np.einsum('ijk,ij->ik', diff, 1.0 / dist2)
         
-        # Attractive forces (for adjacent vertices)
-        for i in range(n_vertices):
-            for j in range(n_vertices):
-                if adj[i, j]:
-                    diff = pos[j] - pos[i]
-                    dist = np.linalg.norm(diff)
-                    if dist > 0:
-                        forces[i] += dist / k * diff / dist
+        # Attractive forces between consecutive (adjacent) vertices:
+        # (dist / k) * (diff / dist) reduces to diff / k
+        pull = (pos[1:] - pos[:-1]) / k
+        forces[:-1] += pull
+        forces[1:] -= pull
         
         # Update positions
         pos += dt * forces
@@ -206,22 +336,13 @@ def hypercube_unfolding(vertices: List[int], dimension: int) -> np.ndarray:
     np.ndarray
         Coordinates (n_vertices, 2)
     """
-    n_vertices = len(vertices)
-    pos = np.zeros((n_vertices, 2))
-    
-    # Simple unfolding: use Gray code ordering
-    for i, vertex in enumerate(vertices):
-        # Convert to binary and use as coordinates
-        x = 0
-        y = 0
-        for j in range(min(dimension, 16)):  # Limit to avoid overflow
-            bit = (vertex >> j) & 1
-            if j % 2 == 0:
-                x += bit * (2 ** (j // 2))
-            else:
-                y += bit * (2 ** (j // 2))
-        
-        pos[i] = [x, y]
+    # Simple unfolding: even bits form x, odd bits form y, bit j weighted
+    # by 2**(j // 2); limited to 16 bits to avoid overflow
+    bits = vertex_bit_matrix(vertices, min(dimension, 16)).astype(np.float64)
+    weights = 2.0 ** np.arange((bits.shape[1] + 1) // 2)
+    x = bits[:, 0::2] @ weights
+    y = bits[:, 1::2] @ weights[:bits.shape[1] // 2]
+    pos = np.column_stack([x, y])
     
     # Normalize
     if np.max(pos) > 0:
@@ -252,7 +373,22 @@ def get_projection_method(method: str = 'pca'):
     return methods.get(method, pca_projection)
 
 
-def create_figure_layout(n_plots: int, figsize: Tuple[int, int] = (16, 16)) -> Tuple[plt.Figure, List]:
+def configure_headless() -> None:
+    """Select matplotlib's non-interactive Agg backend.
+    
+    For batch jobs that render through pyplot (for example the
+    ``show_plot=True`` views or ``plt.savefig`` in scripts); call it before
+    the first figure is created so no GUI backend is initialized. Views
+    called with ``show_plot=False`` already render on Agg and do not
+    need it.
+    """
+    if not HAS_MATPLOTLIB:
+        raise ImportError("matplotlib required")
+    import matplotlib
+    matplotlib.use('Agg')
+
+
+def create_figure_layout(n_plots: int, figsize: Tuple[int, int] = (16, 16)) -> Tuple["plt.Figure", List]:
     """Create figure with subplot layout.
     
     Parameters
@@ -269,6 +405,7 @@ def create_figure_layout(n_plots: int, figsize: Tuple[int, int] = (16, 16)) -> T
     """
     if not HAS_MATPLOTLIB:
         raise ImportError("matplotlib required")
+    import matplotlib.pyplot as plt
     
     # Calculate grid dimensions
     n_cols = int(np.ceil(np.sqrt(n_plots)))
@@ -305,10 +442,29 @@ def apply_styling(ax, dimension: int, length: int, color_scheme: Dict = None):
     color_scheme : Dict, optional
         Color scheme (default: None, uses default)
     """
+    apply_styling_bulk([ax], [f'Dimension {dimension} (Length {length})'], color_scheme)
+
+
+def apply_styling_bulk(axes: List, titles: List[str], color_scheme: Dict = None):
+    """Apply consistent styling to several axes at once.
+    
+    Shared properties are set with a single ``setp`` call over all axes.
+    
+    Parameters
+    ----------
+    axes : List[matplotlib.axes.Axes]
+        Axes to style
+    titles : List[str]
+        Title for each axes
+    color_scheme : Dict, optional
+        Color scheme (default: None, uses default)
+    """
+    from matplotlib.artist import setp
+    
     if color_scheme is None:
         color_scheme = get_color_scheme()
     
-    ax.set_title(f'Dimension {dimension} (Length {length})', fontsize=10)
-    ax.grid(True, alpha=color_scheme['grid_alpha'], color=color_scheme['grid_color'])
-    ax.set_facecolor(color_scheme['background_color'])
-
+    setp(axes, facecolor=color_scheme['background_color'])
+    for ax, title in zip(axes, titles):
+        ax.set_title(title, fontsize=10)
+        ax.grid(True, alpha=color_scheme['grid_alpha'], color=color_scheme['grid_color'])
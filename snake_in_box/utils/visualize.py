@@ -1,8 +1,21 @@
 """Visualization tools for snake-in-the-box."""
 
 from typing import List
+import numpy as np
 from ..core.snake_node import SnakeNode
-from ..core.transitions import transition_to_vertex
+from ..core.transitions import transition_to_vertex_array
+
+# The 12 edges of the unit cube as ((x, y, z), (x, y, z)) segments, each
+# joining vertex i to a higher neighbour i ^ (1 << dim)
+_CUBE_EDGES = tuple(
+    (
+        ((i >> 0) & 1, (i >> 1) & 1, (i >> 2) & 1),
+        ((j >> 0) & 1, (j >> 1) & 1, (j >> 2) & 1),
+    )
+    for i in range(8)
+    for j in (i ^ (1 << dim) for dim in range(3))
+    if j > i
+)
 
 
 def visualize_snake_3d(snake_node: SnakeNode, show_hypercube: bool = True) -> None:
@@ -38,6 +51,7 @@ def visualize_snake_3d(snake_node: SnakeNode, show_hypercube: bool = True) -> No
     try:
         import matplotlib.pyplot as plt
         from mpl_toolkits.mplot3d import Axes3D
+        from mpl_toolkits.mplot3d.art3d import Line3DCollection
     except ImportError:
         raise ImportError(
             "matplotlib is required for visualization. "
@@ -45,15 +59,14 @@ def visualize_snake_3d(snake_node: SnakeNode, show_hypercube: bool = True) -> No
         )
     
     # Get vertex sequence
-    vertices = transition_to_vertex(
+    vertices = transition_to_vertex_array(
         snake_node.transition_sequence,
         snake_node.dimension
     )
     
-    # Extract coordinates
-    x = [(v >> 0) & 1 for v in vertices]
-    y = [(v >> 1) & 1 for v in vertices]
-    z = [(v >> 2) & 1 for v in vertices]
+    # Extract coordinates: bit j of each vertex is its j-th axis
+    xyz = (vertices[:, None] >> np.arange(3, dtype=vertices.dtype)) & 1
+    x, y, z = xyz[:, 0], xyz[:, 1], xyz[:, 2]
     
     # Create figure
     fig = plt.figure(figsize=(10, 8))
@@ -64,17 +77,9 @@ def visualize_snake_3d(snake_node: SnakeNode, show_hypercube: bool = True) -> No
     
     # Draw cube edges if requested
     if show_hypercube:
-        for i in range(8):
-            for dim in range(3):
-                neighbor = i ^ (1 << dim)
-                if neighbor > i:  # Draw each edge once
-                    xi, yi, zi = (i >> 0) & 1, (i >> 1) & 1, (i >> 2) & 1
-                    xn, yn, zn = (
-                        (neighbor >> 0) & 1,
-                        (neighbor >> 1) & 1,
-                        (neighbor >> 2) & 1
-                    )
-                    ax.plot([xi, xn], [yi, yn], [zi, zn], 'k-', alpha=0.3, linewidth=0.5)
+        ax.add_collection3d(Line3DCollection(
+            _CUBE_EDGES, colors='k', alpha=0.3, linewidths=0.5
+        ))
     
     # Labels and title
     ax.set_xlabel('X')
@@ -1,16 +1,15 @@
 """Visualization functions for dimensions 1-16."""
 
-from typing import List, Optional, Tuple
+import hashlib
+import os
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from importlib.util import find_spec
+from typing import List, Optional, Sequence, Tuple
 import numpy as np
-try:
-    import matplotlib.pyplot as plt
-    from mpl_toolkits.mplot3d import Axes3D
-    HAS_MATPLOTLIB = True
-except ImportError:
-    HAS_MATPLOTLIB = False
-
 from ..core.snake_node import SnakeNode
-from ..core.transitions import transition_to_vertex
+from ..core.transitions import transition_to_vertex_array
+from ._pool import spawn_context
 from .visualization_helpers import (
     get_color_scheme,
     pca_projection,
@@ -18,10 +17,112 @@ from .visualization_helpers import (
     force_directed_layout,
     hypercube_unfolding,
     apply_styling,
+    vertex_bit_matrix,
 )
+from .visualize import _CUBE_EDGES
+
+# matplotlib is imported inside the views, and pyplot only by views that
+# are shown, so headless renders never initialize a GUI backend
+HAS_MATPLOTLIB = find_spec('matplotlib') is not None
+
+# Default color scheme, read-only and shared by every view in this module
+_COLOR_SCHEME = get_color_scheme()
+
+# Vertex count above which the 3D projection draws one-pixel rasterized
+# points in a single color; the path still carries the sequence gradient
+_DENSE_PROJECTION_POINTS = 5000
+
+# Longest side, in inches, of a downsampled heatmap or transition matrix;
+# the long axis is then decimated to about two samples per rendered pixel
+_MAX_MATRIX_INCHES = 40
+
+# Vertex arrays and bit matrices of recently drawn snakes, keyed by
+# (transition digest, dimension), so several views of one snake share them
+_VERTEX_CACHE_SIZE = 64
+_vertex_cache: "OrderedDict[Tuple[bytes, int], Tuple[np.ndarray, np.ndarray]]" = OrderedDict()
+
+
+def _vertices_and_bits(snake_node: SnakeNode) -> Tuple[np.ndarray, np.ndarray]:
+    """Return the cached vertex array and bit matrix of a snake.
+    
+    The arrays are shared between calls and marked read-only.
+    """
+    transitions = np.asarray(snake_node.transition_sequence, dtype=np.int64)
+    key = (
+        hashlib.blake2b(transitions.tobytes(), digest_size=16).digest(),
+        snake_node.dimension,
+    )
+    cached = _vertex_cache.get(key)
+    if cached is not None:
+        _vertex_cache.move_to_end(key)
+        return cached
+    
+    vertices = transition_to_vertex_array(transitions, snake_node.dimension)
+    bits = vertex_bit_matrix(vertices, snake_node.dimension)
+    vertices.setflags(write=False)
+    bits.setflags(write=False)
+    
+    _vertex_cache[key] = (vertices, bits)
+    if len(_vertex_cache) > _VERTEX_CACHE_SIZE:
+        _vertex_cache.popitem(last=False)
+    
+    return vertices, bits
 
 
-def visualize_snake_1d(snake_node: SnakeNode, show_plot: bool = True) -> Optional[plt.Figure]:
+def _make_figure(figsize, show_plot: bool) -> "plt.Figure":
+    """Create the figure for a view.
+    
+    Figures that will be shown go through pyplot. Otherwise the caller
+    only saves or inspects the figure, so a bare ``Figure`` on an Agg
+    canvas skips pyplot's figure manager and never touches the GUI
+    backend; ``plt.close`` on it is a harmless no-op.
+    """
+    if show_plot:
+        import matplotlib.pyplot as plt
+        return plt.figure(figsize=figsize)
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+    fig = Figure(figsize=figsize)
+    FigureCanvasAgg(fig)
+    return fig
+
+
+def _show() -> None:
+    """Show the figures created through pyplot."""
+    import matplotlib.pyplot as plt
+    plt.show()
+
+
+def _draw_path_2d(ax, x, y, color_scheme) -> None:
+    """Draw a snake path as one rasterized LineCollection plus one scatter.
+    
+    Replaces a marker-carrying Line2D, whose per-vertex markers are slow
+    to draw and become one primitive each in vector output.
+    """
+    from matplotlib.collections import LineCollection
+    points = np.column_stack((x, y)).astype(np.float64)
+    segments = np.stack((points[:-1], points[1:]), axis=1)
+    ax.add_collection(LineCollection(
+        segments,
+        colors=color_scheme['snake_color'],
+        linewidths=color_scheme['snake_linewidth'],
+        zorder=2,
+        rasterized=True,
+    ))
+    ax.scatter(points[:, 0], points[:, 1],
+               s=color_scheme['snake_markersize'] ** 2,
+               color=color_scheme['snake_color'],
+               marker=color_scheme['snake_marker'],
+               zorder=3,
+               rasterized=True)
+
+
+def _downsample_stride(n_items: int, pixels: float) -> int:
+    """Return the stride that keeps about two of n_items per pixel."""
+    return max(1, n_items // max(1, int(pixels * 2)))
+
+
+def visualize_snake_1d(snake_node: SnakeNode, show_plot: bool = True) -> Optional["plt.Figure"]:
     """Visualize 1D snake as line plot.
     
     Parameters
@@ -42,17 +143,15 @@ def visualize_snake_1d(snake_node: SnakeNode, show_plot: bool = True) -> Optiona
     if snake_node.dimension != 1:
         raise ValueError(f"1D visualization only for dimension 1, got {snake_node.dimension}")
     
-    vertices = transition_to_vertex(snake_node.transition_sequence, 1)
-    x = [(v >> 0) & 1 for v in vertices]
-    y = list(range(len(vertices)))
+    vertices, bits = _vertices_and_bits(snake_node)
+    x = bits[:, 0]
+    y = np.arange(len(vertices))
     
-    color_scheme = get_color_scheme()
-    fig, ax = plt.subplots(figsize=(6, 8))
+    color_scheme = _COLOR_SCHEME
+    fig = _make_figure((6, 8), show_plot)
+    ax = fig.add_subplot(111)
     
-    ax.plot(x, y, color=color_scheme['snake_color'], 
-            marker=color_scheme['snake_marker'],
-            linewidth=color_scheme['snake_linewidth'],
-            markersize=color_scheme['snake_markersize'])
+    _draw_path_2d(ax, x, y, color_scheme)
     
     ax.set_xlabel('Bit Value')
     ax.set_ylabel('Position')
@@ -61,12 +160,12 @@ def visualize_snake_1d(snake_node: SnakeNode, show_plot: bool = True) -> Optiona
     ax.grid(True, alpha=color_scheme['grid_alpha'])
     
     if show_plot:
-        plt.show()
+        _show()
     
     return fig
 
 
-def visualize_snake_2d(snake_node: SnakeNode, show_plot: bool = True) -> Optional[plt.Figure]:
+def visualize_snake_2d(snake_node: SnakeNode, show_plot: bool = True) -> Optional["plt.Figure"]:
     """Visualize 2D snake as grid plot.
     
     Parameters
@@ -87,17 +186,14 @@ def visualize_snake_2d(snake_node: SnakeNode, show_plot: bool = True) -> Optiona
     if snake_node.dimension != 2:
         raise ValueError(f"2D visualization only for dimension 2, got {snake_node.dimension}")
     
-    vertices = transition_to_vertex(snake_node.transition_sequence, 2)
-    x = [(v >> 0) & 1 for v in vertices]
-    y = [(v >> 1) & 1 for v in vertices]
+    vertices, bits = _vertices_and_bits(snake_node)
+    x, y = bits.T
     
-    color_scheme = get_color_scheme()
-    fig, ax = plt.subplots(figsize=(8, 8))
+    color_scheme = _COLOR_SCHEME
+    fig = _make_figure((8, 8), show_plot)
+    ax = fig.add_subplot(111)
     
-    ax.plot(x, y, color=color_scheme['snake_color'],
-            marker=color_scheme['snake_marker'],
-            linewidth=color_scheme['snake_linewidth'],
-            markersize=color_scheme['snake_markersize'])
+    _draw_path_2d(ax, x, y, color_scheme)
     
     # Draw grid
     ax.set_xlim(-0.1, 1.1)
@@ -111,12 +207,12 @@ def visualize_snake_2d(snake_node: SnakeNode, show_plot: bool = True) -> Optiona
     ax.set_title(f'2D Snake (Length {len(vertices) - 1})')
     
     if show_plot:
-        plt.show()
+        _show()
     
     return fig
 
 
-def visualize_snake_3d_advanced(snake_node: SnakeNode, show_plot: bool = True) -> Optional[plt.Figure]:
+def visualize_snake_3d_advanced(snake_node: SnakeNode, show_plot: bool = True) -> Optional["plt.Figure"]:
     """Enhanced 3D visualization.
     
     Parameters
@@ -137,13 +233,15 @@ def visualize_snake_3d_advanced(snake_node: SnakeNode, show_plot: bool = True) -
     if snake_node.dimension != 3:
         raise ValueError(f"3D visualization only for dimension 3, got {snake_node.dimension}")
     
-    vertices = transition_to_vertex(snake_node.transition_sequence, 3)
-    x = [(v >> 0) & 1 for v in vertices]
-    y = [(v >> 1) & 1 for v in vertices]
-    z = [(v >> 2) & 1 for v in vertices]
+    vertices, bits = _vertices_and_bits(snake_node)
+    x, y, z = bits.T
+    
+    color_scheme = _COLOR_SCHEME
+    # The 3D toolkit is only loaded by the 3D views
+    from mpl_toolkits.mplot3d import Axes3D  # noqa: F401
+    from mpl_toolkits.mplot3d.art3d import Line3DCollection
     
-    color_scheme = get_color_scheme()
-    fig = plt.figure(figsize=(10, 8))
+    fig = _make_figure((10, 8), show_plot)
     ax = fig.add_subplot(111, projection='3d')
     
     ax.plot(x, y, z, color=color_scheme['snake_color'],
@@ -152,13 +250,9 @@ def visualize_snake_3d_advanced(snake_node: SnakeNode, show_plot: bool = True) -
             markersize=color_scheme['snake_markersize'])
     
     # Draw cube edges
-    for i in range(8):
-        for dim in range(3):
-            neighbor = i ^ (1 << dim)
-            if neighbor > i:
-                xi, yi, zi = (i >> 0) & 1, (i >> 1) & 1, (i >> 2) & 1
-                xn, yn, zn = (neighbor >> 0) & 1, (neighbor >> 1) & 1, (neighbor >> 2) & 1
-                ax.plot([xi, xn], [yi, yn], [zi, zn], 'k-', alpha=0.3, linewidth=0.5)
+    ax.add_collection3d(Line3DCollection(
+        _CUBE_EDGES, colors='k', alpha=0.3, linewidths=0.5
+    ))
     
     ax.set_xlabel('X')
     ax.set_ylabel('Y')
@@ -167,7 +261,7 @@ def visualize_snake_3d_advanced(snake_node: SnakeNode, show_plot: bool = True) -
     ax.set_box_aspect([1, 1, 1])
     
     if show_plot:
-        plt.show()
+        _show()
     
     return fig
 
@@ -178,7 +272,7 @@ def visualize_snake_nd(
     show_plot: bool = True,
     dim1: Optional[int] = None,
     dim2: Optional[int] = None
-) -> Optional[plt.Figure]:
+) -> Optional["plt.Figure"]:
     """Visualize snake in N dimensions using projection.
     
     Parameters
@@ -205,31 +299,30 @@ def visualize_snake_nd(
     if snake_node.dimension <= 3:
         raise ValueError(f"Use dimension-specific visualization for dim <= 3")
     
-    vertices = transition_to_vertex(snake_node.transition_sequence, snake_node.dimension)
-    color_scheme = get_color_scheme()
+    vertices, bits = _vertices_and_bits(snake_node)
+    color_scheme = _COLOR_SCHEME
     
     # Get projection coordinates
     if method == 'pairwise':
         if dim1 is None or dim2 is None:
             dim1, dim2 = 0, 1
         x, y = pairwise_projection(vertices, snake_node.dimension, dim1, dim2)
-        coords = np.array([[xi, yi] for xi, yi in zip(x, y)])
+        coords = np.column_stack((x, y))
     elif method == 'pca':
-        coords = pca_projection(vertices, snake_node.dimension, n_components=2)
+        coords = pca_projection(vertices, snake_node.dimension, n_components=2,
+                                bit_matrix=bits)
     elif method == 'force':
         coords = force_directed_layout(vertices, snake_node.dimension)
     elif method == 'unfolding':
         coords = hypercube_unfolding(vertices, snake_node.dimension)
     else:
-        coords = pca_projection(vertices, snake_node.dimension, n_components=2)
+        coords = pca_projection(vertices, snake_node.dimension, n_components=2,
+                                bit_matrix=bits)
     
-    fig, ax = plt.subplots(figsize=(10, 10))
+    fig = _make_figure((10, 10), show_plot)
+    ax = fig.add_subplot(111)
     
-    ax.plot(coords[:, 0], coords[:, 1],
-            color=color_scheme['snake_color'],
-            marker=color_scheme['snake_marker'],
-            linewidth=color_scheme['snake_linewidth'],
-            markersize=color_scheme['snake_markersize'])
+    _draw_path_2d(ax, coords[:, 0], coords[:, 1], color_scheme)
     
     ax.set_xlabel(f'Projection 1 ({method})')
     ax.set_ylabel(f'Projection 2 ({method})')
@@ -238,12 +331,12 @@ def visualize_snake_nd(
     ax.set_aspect('equal')
     
     if show_plot:
-        plt.show()
+        _show()
     
     return fig
 
 
-def visualize_snake_auto(snake_node: SnakeNode, show_plot: bool = True) -> Optional[plt.Figure]:
+def visualize_snake_auto(snake_node: SnakeNode, show_plot: bool = True) -> Optional["plt.Figure"]:
     """Automatically choose appropriate visualization method.
     
     Parameters
@@ -270,7 +363,11 @@ def visualize_snake_auto(snake_node: SnakeNode, show_plot: bool = True) -> Optio
         return visualize_snake_nd(snake_node, method='pca', show_plot=show_plot)
 
 
-def visualize_snake_heatmap(snake_node: SnakeNode, show_plot: bool = True) -> Optional[plt.Figure]:
+def visualize_snake_heatmap(
+    snake_node: SnakeNode,
+    show_plot: bool = True,
+    downsample: bool = True
+) -> Optional["plt.Figure"]:
     """Visualize snake as heatmap showing bit patterns.
     
     Parameters
@@ -279,6 +376,9 @@ def visualize_snake_heatmap(snake_node: SnakeNode, show_plot: bool = True) -> Op
         Snake node to visualize
     show_plot : bool, optional
         Show plot immediately (default: True)
+    downsample : bool, optional
+        Cap the figure height and keep every k-th vertex so that about two
+        rows are drawn per pixel; False draws every vertex (default: True)
     
     Returns
     -------
@@ -288,33 +388,43 @@ def visualize_snake_heatmap(snake_node: SnakeNode, show_plot: bool = True) -> Op
     if not HAS_MATPLOTLIB:
         raise ImportError("matplotlib required for visualization")
     
-    vertices = transition_to_vertex(snake_node.transition_sequence, snake_node.dimension)
+    vertices, bits = _vertices_and_bits(snake_node)
     
-    # Create binary matrix
+    # The cached uint8 bit matrix is drawn as is; imshow only reads it
     n_vertices = len(vertices)
-    binary_matrix = np.zeros((n_vertices, snake_node.dimension))
+    binary_matrix = bits
     
-    for i, vertex in enumerate(vertices):
-        for j in range(snake_node.dimension):
-            binary_matrix[i, j] = (vertex >> j) & 1
+    height = max(6, n_vertices // 10)
+    if downsample:
+        height = min(height, _MAX_MATRIX_INCHES)
+    fig = _make_figure((max(8, snake_node.dimension), height), show_plot)
+    ax = fig.add_subplot(111)
+    if downsample:
+        stride = _downsample_stride(n_vertices, height * fig.dpi)
+        binary_matrix = binary_matrix[::stride]
     
-    fig, ax = plt.subplots(figsize=(max(8, snake_node.dimension), max(6, n_vertices // 10)))
-    im = ax.imshow(binary_matrix, aspect='auto', cmap='RdYlBu_r', interpolation='nearest')
+    # Extent in vertex indices, so ticks are unaffected by decimation
+    im = ax.imshow(binary_matrix, aspect='auto', cmap='RdYlBu_r', interpolation='nearest',
+                   extent=(-0.5, snake_node.dimension - 0.5, n_vertices - 0.5, -0.5))
     
     ax.set_xlabel('Bit Position')
     ax.set_ylabel('Vertex Index')
     ax.set_title(f'{snake_node.dimension}D Snake Heatmap (Length {n_vertices - 1})')
     ax.set_yticks(range(0, n_vertices, max(1, n_vertices // 20)))
     
-    plt.colorbar(im, ax=ax, label='Bit Value')
+    fig.colorbar(im, ax=ax, label='Bit Value')
     
     if show_plot:
-        plt.show()
+        _show()
     
     return fig
 
 
-def visualize_snake_3d_projection(snake_node: SnakeNode, show_plot: bool = True) -> Optional[plt.Figure]:
+def visualize_snake_3d_projection(
+    snake_node: SnakeNode,
+    show_plot: bool = True,
+    max_points: Optional[int] = None
+) -> Optional["plt.Figure"]:
     """Visualize high-dimensional snake using 3D PCA projection.
     
     Parameters
@@ -323,6 +433,9 @@ def visualize_snake_3d_projection(snake_node: SnakeNode, show_plot: bool = True)
         Snake node to visualize (dimension >= 4)
     show_plot : bool, optional
         Show plot immediately (default: True)
+    max_points : Optional[int], optional
+        Draw every k-th vertex so that at most this many are plotted;
+        None draws every vertex (default: None)
     
     Returns
     -------
@@ -335,47 +448,50 @@ def visualize_snake_3d_projection(snake_node: SnakeNode, show_plot: bool = True)
     if snake_node.dimension < 4:
         raise ValueError("3D projection requires dimension >= 4")
     
-    vertices = transition_to_vertex(snake_node.transition_sequence, snake_node.dimension)
+    vertices, bits = _vertices_and_bits(snake_node)
     
-    # Convert to binary matrix
+    # Project to the top three principal axes; a snake with no more
+    # vertices than bits spans too few directions for PCA to matter, so
+    # its centered first three bits are drawn directly
     n_vertices = len(vertices)
-    binary_matrix = np.zeros((n_vertices, snake_node.dimension))
-    
-    for i, vertex in enumerate(vertices):
-        for j in range(snake_node.dimension):
-            binary_matrix[i, j] = (vertex >> j) & 1
-    
-    # Center the data
-    mean = np.mean(binary_matrix, axis=0)
-    centered = binary_matrix - mean
-    
-    # Compute covariance matrix
-    cov = np.cov(centered.T)
-    
-    # Eigenvalue decomposition
-    eigenvalues, eigenvectors = np.linalg.eigh(cov)
-    
-    # Sort by eigenvalue (descending)
-    idx = eigenvalues.argsort()[::-1]
-    eigenvectors = eigenvectors[:, idx]
-    
-    # Project to 3D
-    coords = centered @ eigenvectors[:, :3]
-    
-    color_scheme = get_color_scheme()
-    fig = plt.figure(figsize=(12, 10))
+    if n_vertices <= max(4, snake_node.dimension + 1):
+        coords = bits[:, :3] - bits[:, :3].mean(axis=0)
+    else:
+        coords = pca_projection(vertices, snake_node.dimension, n_components=3,
+                                bit_matrix=bits)
+    if max_points is not None and n_vertices > max_points:
+        stride = int(np.ceil(n_vertices / max(1, max_points)))
+        coords = coords[::stride]
+    n_points = len(coords)
+    dense = n_points > _DENSE_PROJECTION_POINTS
+    
+    color_scheme = _COLOR_SCHEME
+    # The 3D toolkit is only loaded by the 3D views
+    from mpl_toolkits.mplot3d import Axes3D  # noqa: F401
+    from mpl_toolkits.mplot3d.art3d import Line3DCollection
+    
+    fig = _make_figure((12, 10), show_plot)
     ax = fig.add_subplot(111, projection='3d')
     
-    # Color by position in sequence
-    colors = plt.cm.viridis(np.linspace(0, 1, n_vertices))
-    
-    ax.scatter(coords[:, 0], coords[:, 1], coords[:, 2],
-               c=colors, s=50, alpha=0.6)
-    
-    ax.plot(coords[:, 0], coords[:, 1], coords[:, 2],
-            color=color_scheme['snake_color'],
-            linewidth=color_scheme['snake_linewidth'],
-            alpha=0.5)
+    # Path as one collection of segments colored by position in sequence
+    if n_points > 1:
+        segments = np.stack((coords[:-1], coords[1:]), axis=1)
+        path = Line3DCollection(segments, cmap='viridis',
+                                linewidths=color_scheme['snake_linewidth'],
+                                alpha=0.5, rasterized=dense)
+        path.set_array(np.linspace(0, 1, n_points - 1))
+        ax.add_collection3d(path)
+    
+    # Vertices as small flat markers rather than shaded glyphs; dense
+    # snakes get single-pixel points without a per-point colormap
+    if dense:
+        ax.scatter(coords[:, 0], coords[:, 1], coords[:, 2],
+                   color=color_scheme['snake_color'], s=1, marker='s',
+                   depthshade=False, rasterized=True)
+    else:
+        ax.scatter(coords[:, 0], coords[:, 1], coords[:, 2],
+                   c=np.arange(n_points, dtype=np.float32), cmap='viridis',
+                   s=4, marker='.', alpha=0.8, depthshade=False)
     
     ax.set_xlabel('PC1')
     ax.set_ylabel('PC2')
@@ -383,12 +499,16 @@ def visualize_snake_3d_projection(snake_node: SnakeNode, show_plot: bool = True)
     ax.set_title(f'{snake_node.dimension}D Snake 3D Projection (Length {n_vertices - 1})')
     
     if show_plot:
-        plt.show()
+        _show()
     
     return fig
 
 
-def visualize_snake_transition_matrix(snake_node: SnakeNode, show_plot: bool = True) -> Optional[plt.Figure]:
+def visualize_snake_transition_matrix(
+    snake_node: SnakeNode,
+    show_plot: bool = True,
+    downsample: bool = True
+) -> Optional["plt.Figure"]:
     """Visualize transition sequence as matrix showing dimension usage.
     
     Parameters
@@ -397,6 +517,10 @@ def visualize_snake_transition_matrix(snake_node: SnakeNode, show_plot: bool = T
         Snake node to visualize
     show_plot : bool, optional
         Show plot immediately (default: True)
+    downsample : bool, optional
+        Cap the figure width and keep every k-th transition so that about
+        two columns are drawn per pixel; False draws every transition
+        (default: True)
     
     Returns
     -------
@@ -409,25 +533,106 @@ def visualize_snake_transition_matrix(snake_node: SnakeNode, show_plot: bool = T
     transitions = snake_node.transition_sequence
     n_transitions = len(transitions)
     
-    # Create transition matrix
-    transition_matrix = np.zeros((snake_node.dimension, n_transitions))
+    # Create transition matrix, one byte per 0/1 cell
+    transition_matrix = np.zeros((snake_node.dimension, n_transitions), dtype=np.uint8)
+    
+    # Mark each in-range transition at (dimension, position) in one scatter
+    t = np.asarray(transitions, dtype=np.int64)
+    in_range = (t >= 0) & (t < snake_node.dimension)
+    transition_matrix[t[in_range], np.nonzero(in_range)[0]] = 1
     
-    for i, trans in enumerate(transitions):
-        if 0 <= trans < snake_node.dimension:
-            transition_matrix[trans, i] = 1
+    width = max(8, n_transitions // 10)
+    if downsample:
+        width = min(width, _MAX_MATRIX_INCHES)
+    fig = _make_figure((width, max(6, snake_node.dimension)), show_plot)
+    ax = fig.add_subplot(111)
+    if downsample:
+        stride = _downsample_stride(n_transitions, width * fig.dpi)
+        transition_matrix = transition_matrix[:, ::stride]
     
-    fig, ax = plt.subplots(figsize=(max(8, n_transitions // 10), max(6, snake_node.dimension)))
-    im = ax.imshow(transition_matrix, aspect='auto', cmap='YlOrRd', interpolation='nearest')
+    # Extent in sequence positions, so ticks are unaffected by decimation
+    im = ax.imshow(transition_matrix, aspect='auto', cmap='YlOrRd', interpolation='nearest',
+                   extent=(-0.5, n_transitions - 0.5, snake_node.dimension - 0.5, -0.5))
     
     ax.set_xlabel('Position in Sequence')
     ax.set_ylabel('Dimension')
     ax.set_title(f'Transition Matrix for {snake_node.dimension}D Snake (Length {n_transitions})')
     ax.set_yticks(range(snake_node.dimension))
     
-    plt.colorbar(im, ax=ax, label='Dimension Used')
+    fig.colorbar(im, ax=ax, label='Dimension Used')
     
     if show_plot:
-        plt.show()
+        _show()
     
     return fig
 
+
+# Views available to visualize_many(), by kind
+_BATCH_VIEWS = {
+    'auto': visualize_snake_auto,
+    'heatmap': visualize_snake_heatmap,
+    '3d_projection': visualize_snake_3d_projection,
+    'transition_matrix': visualize_snake_transition_matrix,
+}
+
+
+def _render_to_file(kind: str, snake_node: SnakeNode, path: str, dpi: int) -> str:
+    """Render one view without pyplot and save it to path."""
+    fig = _BATCH_VIEWS[kind](snake_node, show_plot=False)
+    fig.savefig(path, dpi=dpi, bbox_inches='tight')
+    return path
+
+
+def visualize_many(
+    snake_nodes: Sequence[SnakeNode],
+    kind: str = 'auto',
+    output_dir: str = '.',
+    max_workers: Optional[int] = None,
+    dpi: int = 150
+) -> List[str]:
+    """Render one view of many snakes to PNG files in worker processes.
+    
+    Each snake is saved as ``<index>.png`` (six digits) in output_dir.
+    Figures are built on Agg canvases outside pyplot, so workers never
+    start a GUI backend and hold one figure at a time.
+    
+    Parameters
+    ----------
+    snake_nodes : Sequence[SnakeNode]
+        Snakes to render
+    kind : str, optional
+        View to render: 'auto', 'heatmap', '3d_projection' or
+        'transition_matrix' (default: 'auto')
+    output_dir : str, optional
+        Directory for the images, created if missing (default: '.')
+    max_workers : Optional[int], optional
+        Number of worker processes; 1 renders in this process
+        (default: ProcessPoolExecutor default)
+    dpi : int, optional
+        Resolution in dots per inch (default: 150)
+    
+    Returns
+    -------
+    List[str]
+        Paths of the saved images, in input order
+    """
+    if not HAS_MATPLOTLIB:
+        raise ImportError("matplotlib required for visualization")
+    if kind not in _BATCH_VIEWS:
+        raise ValueError(f"Unknown view {kind!r}; expected one of {sorted(_BATCH_VIEWS)}")
+    
+    os.makedirs(output_dir, exist_ok=True)
+    nodes = list(snake_nodes)
+    paths = [os.path.join(output_dir, f"{i:06d}.png") for i in range(len(nodes))]
+    
+    if max_workers == 1:
+        return [_render_to_file(kind, node, path, dpi) for node, path in zip(nodes, paths)]
+    
+    with ProcessPoolExecutor(max_workers=max_workers, mp_context=spawn_context()) as executor:
+        return list(executor.map(
+            _render_to_file,
+            [kind] * len(nodes),
+            nodes,
+            paths,
+            [dpi] * len(nodes),
+        ))